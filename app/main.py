@@ -40,8 +40,54 @@
 # │           └── test_items.py
 
 
+import asyncio
+import hashlib
+import json
+import os
 
-def init():
+try:
+    import fcntl
+except ImportError:  # Windows: run without cross-process locking
+    fcntl = None
+
+# Where init() records the inputs of its last successful provisioning run
+INIT_CACHE_FILE = "provisions/dbstack/.cache/init.json"
+# Environment variables that influence env generation and provisioning
+INIT_CACHE_ENV_PREFIXES = ("DB_", "POSTGRES_", "MARIADB_", "MONGO", "INFLUX", "NEO4J_", "REDIS_")
+
+def _init_cache_key(config_path: str) -> str:
+    """Digest of the config file bytes plus the provisioning-related environment."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(config_path, "rb") as file:
+        digest.update(file.read())
+    for name in sorted(k for k in os.environ if k.startswith(INIT_CACHE_ENV_PREFIXES)):
+        digest.update(b"\0" + name.encode() + b"=" + os.environ[name].encode())
+    return digest.hexdigest()
+
+def _read_init_cache(key: str, mtime_ns: int):
+    """Return the cached config when the last successful run used the same inputs."""
+    try:
+        with open(INIT_CACHE_FILE, "r") as file:
+            if fcntl:
+                fcntl.flock(file, fcntl.LOCK_SH)
+            cache = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if cache.get("key") == key and cache.get("mtime") == mtime_ns:
+        return cache.get("config")
+    return None
+
+def _write_init_cache(key: str, mtime_ns: int, config: dict) -> None:
+    """Record a successful run; the exclusive lock keeps concurrent workers from interleaving writes."""
+    os.makedirs(os.path.dirname(INIT_CACHE_FILE), exist_ok=True)
+    with open(INIT_CACHE_FILE, "a+") as file:
+        if fcntl:
+            fcntl.flock(file, fcntl.LOCK_EX)
+        file.seek(0)
+        file.truncate()
+        json.dump({"key": key, "mtime": mtime_ns, "config": config}, file, default=str)
+
+async def init(force: bool = False):
     """
     Initialize the application by:
     1. Generating environment variables from configuration
@@ -49,46 +95,98 @@ def init():
     3. Setting up database control
     4. Managing database migrations
     
+    Steps 1-4 are skipped when the config file and provisioning environment are
+    unchanged since the last successful run, unless `force` is set. A run only
+    counts as successful (and is cached) when env generation exits 0 and
+    provisioning succeeds. Without a config file nothing is cached and the
+    steps always run. Services are always (re)started since their live state
+    may have changed.
+    
+    Args:
+        force: Ignore the init cache and re-run every step (`--force-init`)
+    
     Returns:
-        dict: The loaded configuration from the YAML file
+        dict: The loaded configuration from the YAML file, or None if it is missing
     """
     from src.services.storage.local import local_db_controller, DatabaseService, DatabaseCommand
     from src.services.env.obfuscator_service import env_obfuscator
     from src.controls.db_mng import db_mng_control
     from src.core.flow.config_loader import load_config
     from src.core.utils.scripts import run_env_gen
+    from src.core.logger import logger
     # Define the path to the database configuration YAML file
     # This file contains database connection parameters and other settings
     config_file = "app/db.yml"
     
-    # Generate environment variables (.env file) from the configuration
-    # Arguments:
-    #   - "-c": Flag indicating a config file will follow
-    #   - config_file: Path to the configuration file
-    #   - "-e .env": Output environment file path
-    run_env_gen(["-c "] + [config_file] + ["-e provisions/dbstack/.env"])
+    try:
+        mtime_ns = os.stat(config_file).st_mtime_ns
+        cache_key = _init_cache_key(config_file)
+    except FileNotFoundError:
+        logger.warning("Configuration file %s not found; skipping the init cache", config_file)
+        cache_key = None
+    config = None if force or cache_key is None else _read_init_cache(cache_key, mtime_ns)
     
-    # # Load the configuration from the YAML file into a dictionary
-    # # This will be used throughout the application for various settings
-    # config = load_config(config_file=config_file)
-    # # Return the loaded configuration for use by other parts of the application
+    if config is None:
+        # Generate environment variables (.env file) from the configuration
+        # Arguments:
+        #   - "-c": Flag indicating a config file will follow
+        #   - config_file: Path to the configuration file
+        #   - "-e": Output environment file path follows
+        env_gen_rc = await run_env_gen(["-c", config_file, "-e", "provisions/dbstack/.env"])
+        
+        # Load the configuration from the YAML file into a dictionary
+        # This will be used throughout the application for various settings
+        if cache_key is not None:
+            config = load_config(config_file=config_file)
 
-    # Examples of using the controller
-    local_db_controller.initialize_stack("SecurePassword123")
+        # Examples of using the controller
+        await local_db_controller.initialize_stack("SecurePassword123")
 
-    success = db_mng_control.provision_databases(config_file=config_file)
-    print(f"Provision result: {success}")
+        success = await db_mng_control.provision_databases(config_file=config_file)
+        print(f"Provision result: {success}")
+        
+        # Only a fully successful run may be skipped next time (both results are
+        # script exit codes, 0 = success); the derived lookup index is rebuilt by
+        # load_config, so only the raw config is cached
+        if cache_key is not None:
+            if env_gen_rc == 0 and success == 0:
+                _write_init_cache(cache_key, mtime_ns, {k: v for k, v in config.items() if k != "_index"})
+            else:
+                logger.warning("Init did not complete (env generation exit %s, provisioning exit %s); "
+                               "not caching so the next start retries", env_gen_rc, success)
 
-    local_db_controller.start_service(DatabaseService.POSTGRES)
-    local_db_controller.manage_service(DatabaseService.POSTGRES, DatabaseCommand.CONNECT)  # Connect to Postgres CLI
+    await local_db_controller.start_service(DatabaseService.POSTGRES)
+    await local_db_controller.manage_service(DatabaseService.POSTGRES, DatabaseCommand.CONNECT)  # Connect to Postgres CLI
     
     env_obfuscator.obfuscate(".env", "password6789hjk", "key", ".env.keyd")
     env_obfuscator.deobfuscate(".env.keyd", ".env.keyd.mapping.json", "password6789hjk", "key")
-   
+    
+    # Return the loaded configuration for use by other parts of the application
+    return config
+
+def _loop_factory():
+    """Return uvloop's event loop factory when installed, else None for the stdlib loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+def parse_args():
+    """Parse the command line options shared by init() and serve()."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Start the Database and Environment Management API")
+    parser.add_argument("--host", default="0.0.0.0", help="Host to bind the server to")
+    parser.add_argument("--port", type=int, default=8000, help="Port to bind the server to")
+    parser.add_argument("--reload", action="store_true", help="Enable hot reloading for development")
+    parser.add_argument("--force-init", action="store_true", help="Re-run provisioning even if the init cache is fresh")
+    return parser.parse_args()
 
-def serve():
+def serve(args=None):
+    from contextlib import asynccontextmanager
     from fastapi import FastAPI
     from fastapi.middleware.cors import CORSMiddleware
+    from src.core.responses import FastJSONResponse
     from dotenv import load_dotenv
     from src.rest.v1.routers import api_v1_router
     from src.core.config import settings  # Contains environment-specific settings
@@ -96,8 +194,23 @@ def serve():
     load_dotenv("provisions/dbstack/.env")
     load_dotenv(".env")
 
+    @asynccontextmanager
+    async def lifespan(application: FastAPI):
+        # Same module paths the endpoints import, so the warmed singletons are the ones they use
+        from services.env.obfuscator_service import env_obfuscator
+        from services.storage.local import local_db_controller
+        from rest.v1.helpers import task_workers, cleanup_upload_dir
+        env_obfuscator.warmup()
+        local_db_controller.warmup()
+        # Background tasks submitted by the endpoints run on this worker pool
+        async with task_workers():
+            yield
+        cleanup_upload_dir()
+
     def create_application() -> FastAPI:
         application = FastAPI(
+            lifespan=lifespan,                          # Warm service singletons on startup
+            default_response_class=FastJSONResponse,    # orjson-backed JSON responses when available
             title=settings.PROJECT_NAME,                # Project title from config
             description=settings.PROJECT_DESCRIPTION,   # Project description from config
             version=settings.VERSION,                   # Version number
@@ -121,26 +234,27 @@ def serve():
     app = create_application()
 
     import uvicorn
-     # Add command line argument parsing for host/port configuration
-    import argparse
-    parser = argparse.ArgumentParser(description="Start the Database and Environment Management API")
-    parser.add_argument("--host", default="0.0.0.0", help="Host to bind the server to")
-    parser.add_argument("--port", type=int, default=8000, help="Port to bind the server to")
-    parser.add_argument("--reload", action="store_true", help="Enable hot reloading for development")
-    
-    args = parser.parse_args()
+    # Command line arguments for host/port configuration
+    if args is None:
+        args = parse_args()
     
     uvicorn.run(
         app,  
         host=args.host,
         port=args.port,
-        reload=args.reload
+        reload=args.reload,
+        loop="uvloop" if _loop_factory() else "asyncio"
     )
 
 # Entry point: run the `serve` function only if this file is executed directly (not imported)
 if __name__ == '__main__':
-    init()
-    serve()
+    from src.core.logger import setup_logging
+    setup_logging()
+    args = parse_args()
+    # asyncio.Runner (3.11+) rather than asyncio.run(loop_factory=...), which needs 3.12
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        runner.run(init(force=args.force_init))
+    serve(args)
 
 
 
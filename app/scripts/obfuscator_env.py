@@ -1,13 +1,15 @@
 """
 obfuscator_env.py
 
-A Python script for encrypting and obfuscating environment (.env) files using AES encryption.
+A Python script for encrypting and obfuscating environment (.env) files using authenticated
+encryption (ChaCha20-Poly1305; files written with the older AES-CTR/AES-CBC formats still decrypt).
 It supports both obfuscation and deobfuscation, maintaining a mapping between original and obfuscated keys.
 Enhanced with application key requirement for additional security.
 
 Dependencies:
     - cryptography
-    - argparse
+    - orjson (optional, faster mapping file I/O)
+    - pybase64 (optional, faster base64)
 
 Install cryptography via pip:
     pip install cryptography
@@ -21,24 +23,113 @@ Example usage:
 
     # To deobfuscate a file
     python obfuscator_env.py -i .env.obfuscated -m .env.obfuscated.mapping.json -p "secret" -a "app_key_123" -d
+
+    # To obfuscate into a single file (mapping in the header) and restore it without -m
+    python obfuscator_env.py -i .env -p "secret" -a "app_key_123" --embed-mapping
+    python obfuscator_env.py -i .env.obfuscated -p "secret" -a "app_key_123" -d
 """
 
+import io
 import os
-import argparse
-import base64
+import secrets
+import sys
 import json
 import hmac
 import hashlib
+import struct
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# pybase64 is a drop-in for the base64 functions used here with SIMD (SSSE3/AVX2)
+# codecs; the stdlib module is used when it is not installed.
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder/decoder
+    orjson = None
 
 from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
-from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
+from cryptography.exceptions import InvalidTag
 
 # Global default extension for obfuscated files
 DEFAULT_OUTPUT_EXTENSION = "obfuscated"
 
-def generate_key(password: str, app_key: str, salt: bytes) -> bytes:
+# Value ciphers recorded in the mapping file; files without the field predate CTR
+CIPHER_CHACHA20_POLY1305 = "chacha20-poly1305"
+CIPHER_AES_CTR = "aes-256-ctr"
+CIPHER_AES_CBC = "aes-256-cbc"
+
+# Single-file format (--embed-mapping): the mapping travels in a binary header,
+#   MAGIC(4) | VERSION(2) | SALT(16) | MAPLEN(4) | MAP_JSON(MAPLEN) | encrypted lines
+PACKED_MAGIC = b"DFGE"
+PACKED_VERSION = 1
+_PACKED_HEADER = struct.Struct("<4sH16sI")
+
+# I/O buffer sizes: 64 KiB reads, 128 KiB writes
+READ_BUFFER_SIZE = 1 << 16
+WRITE_BUFFER_SIZE = 1 << 17
+
+# Values are encrypted in batches of this many lines, on up to ENCRYPT_WORKERS
+# threads once a batch has at least PARALLEL_MIN_ENTRIES entries
+ENCRYPT_BATCH_SIZE = 1024
+PARALLEL_MIN_ENTRIES = 64
+ENCRYPT_WORKERS = os.cpu_count() or 1
+
+# Opt-in (--cache-kdf) on-disk cache of Scrypt results, keyed by salt and credentials
+KDF_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "dataforge", "kdf"
+)
+
+def _kdf_cache_path(composite_key: bytes, salt: bytes) -> str:
+    """Cache file for a (credentials, salt) pair; the name reveals neither."""
+    cache_id = hashlib.sha256(salt + hashlib.sha256(composite_key).digest()).hexdigest()
+    return os.path.join(KDF_CACHE_DIR, cache_id)
+
+def _read_cached_key(path: str):
+    """Return the cached 32-byte key, or None if it is missing or unusable."""
+    try:
+        with open(path, 'rb') as file:
+            cached = file.read()
+    except OSError:
+        return None
+    return cached if len(cached) == 32 else None
+
+def _write_cached_key(path: str, key: bytes) -> None:
+    """Store a derived key readable by the owner only; failures just skip the cache."""
+    try:
+        os.makedirs(KDF_CACHE_DIR, mode=0o700, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as file:
+            file.write(key)
+    except OSError:
+        pass
+
+# In-memory memo of derived keys for long-running callers (e.g. the API service
+# running this module in-process): the most recent KEY_MEMO_SIZE (credentials, salt)
+# pairs. Entries are indexed by a BLAKE2b digest of the credentials, never the
+# plaintext, but the derived keys themselves stay in memory until evicted or
+# clear_key_cache() is called.
+KEY_MEMO_SIZE = 32
+_key_memo = OrderedDict()
+_key_memo_lock = threading.Lock()
+
+def clear_key_cache() -> None:
+    """Drop every derived key held in memory (the KDF memo and the value-key caches)."""
+    with _key_memo_lock:
+        _key_memo.clear()
+    derive_value_specific_key.cache_clear()
+    _hmac_sha256_states.cache_clear()
+
+def generate_key(password: str, app_key: str, salt: bytes, cache: bool = False) -> bytes:
     """
     Generates a 32-byte AES encryption key from a password and application key using the Scrypt KDF.
     
@@ -50,111 +141,218 @@ def generate_key(password: str, app_key: str, salt: bytes) -> bytes:
         password (str): The user password to derive the key from.
         app_key (str): Application-specific key required for encryption/decryption.
         salt (bytes): A random salt to make key derivation unique.
+        cache (bool): Reuse/store the derived key under KDF_CACHE_DIR so repeated runs
+                      with the same salt skip Scrypt. This trades away Scrypt's cost for
+                      anyone who can read that directory, so it is off by default.
 
     Returns:
         bytes: The derived encryption key.
     """
     # Combine password and app_key to create a stronger composite key
-    composite_key = f"{password}:{app_key}"
+    # (built as bytes directly: same input as f"{password}:{app_key}".encode())
+    composite_key = password.encode() + b":" + app_key.encode()
+
+    # Scrypt is deterministic, so a repeated (credentials, salt) pair reuses its key
+    memo_id = (hashlib.blake2b(composite_key, digest_size=32).digest(), salt)
+    with _key_memo_lock:
+        key = _key_memo.get(memo_id)
+        if key is not None:
+            _key_memo.move_to_end(memo_id)
+            return key
+
+    key = _derive_key(composite_key, salt, cache)
+    with _key_memo_lock:
+        _key_memo[memo_id] = key
+        if len(_key_memo) > KEY_MEMO_SIZE:
+            _key_memo.popitem(last=False)
+    return key
+
+def _derive_key(composite_key: bytes, salt: bytes, cache: bool) -> bytes:
+    """Run Scrypt for generate_key, going through the opt-in on-disk cache."""
+    if cache:
+        cache_path = _kdf_cache_path(composite_key, salt)
+        cached = _read_cached_key(cache_path)
+        if cached is not None:
+            return cached
     
     kdf = Scrypt(
         salt=salt,
         length=32,
         n=2**14,
         r=8,
-        p=1,
-        backend=default_backend()
+        p=1
     )
-    return kdf.derive(composite_key.encode())
+    key = kdf.derive(composite_key)
+    if cache:
+        _write_cached_key(cache_path, key)
+    return key
+
+# HMAC-SHA256 pad blocks, XORed into the (zero-padded) 64-byte key
+_IPAD = bytes(0x36 for _ in range(64))
+_OPAD = bytes(0x5c for _ in range(64))
+
+@lru_cache(maxsize=16)
+def _hmac_sha256_states(base_key: bytes):
+    """
+    Return SHA-256 objects that have already absorbed the HMAC inner/outer pads.
+
+    The pad blocks only depend on the base key, so they are hashed once per key;
+    each value key then costs two .copy() calls and two short updates.
+    """
+    padded = base_key.ljust(64, b"\0")
+    inner = hashlib.sha256(bytes(a ^ b for a, b in zip(padded, _IPAD)))
+    outer = hashlib.sha256(bytes(a ^ b for a, b in zip(padded, _OPAD)))
+    return inner, outer
 
+@lru_cache(maxsize=1024)
 def derive_value_specific_key(base_key: bytes, original_key_name: str) -> bytes:
     """
     Derives a value-specific encryption key by incorporating the original key name.
     This ensures that if the key name in the mapping is altered, decryption will fail.
 
+    Memoized on (base_key, original_key_name) so repeated runs in the same process
+    (e.g. re-deobfuscating the same file) skip the HMAC entirely.
+
+    Computes HMAC-SHA256(base_key, original_key_name) directly on hashlib
+    (OpenSSL, SHA-NI where available) from precomputed pad states.
+
     Args:
-        base_key (bytes): The base encryption key.
+        base_key (bytes): The base encryption key (at most 64 bytes).
         original_key_name (str): The original environment variable key name.
 
     Returns:
         bytes: A 32-byte key derived from the base key and original key name.
     """
-    # Create an HMAC using the base key and the original key name
-    h = hmac.new(base_key, original_key_name.encode(), hashlib.sha256)
-    return h.digest()
+    inner_state, outer_state = _hmac_sha256_states(base_key)
+    inner = inner_state.copy()
+    inner.update(original_key_name.encode())
+    outer = outer_state.copy()
+    outer.update(inner.digest())
+    return outer.digest()
+
+def _aes_ctr(data: bytes, key: bytes, iv: bytes) -> bytes:
+    """
+    AES-CTR transform (encryption and decryption are the same operation), for
+    files written before the switch to ChaCha20-Poly1305.
+
+    cryptography dispatches to OpenSSL's EVP AES implementation, which uses the
+    AES-NI instructions whenever the CPU provides them; CTR blocks are
+    independent, so OpenSSL can pipeline several of them at once.
+    """
+    cipher = Cipher(algorithms.AES(key), modes.CTR(iv)).encryptor()
+    return cipher.update(data) + cipher.finalize()
+
+def _aes_cbc_decrypt(data: bytes, key: bytes, iv: bytes) -> bytes:
+    """AES-CBC decrypt to padded plaintext, for files written before the switch to CTR."""
+    decryptor = Cipher(algorithms.AES(key), modes.CBC(iv)).decryptor()
+    return decryptor.update(data) + decryptor.finalize()
 
 def encrypt_value(value: str, key: bytes, original_key_name: str) -> str:
     """
-    Encrypts a plaintext string using AES-CBC encryption with a key derived from
+    Encrypts a plaintext string using ChaCha20-Poly1305 with a key derived from
     both the main encryption key and the original key name.
 
+    A one-shot stream AEAD: no padding, and the 16-byte Poly1305 tag (with the
+    original key name as associated data) authenticates each value on its own.
+
     Args:
         value (str): The plaintext value to encrypt.
         key (bytes): The base AES key.
         original_key_name (str): The original key name to bind to the encryption.
 
     Returns:
-        str: The base64-encoded ciphertext, including the IV.
+        str: The base64-encoded nonce, ciphertext and tag.
     """
     # Derive a key-specific encryption key
     value_key = derive_value_specific_key(key, original_key_name)
     
-    iv = os.urandom(16)  # Initialization vector
-    cipher = Cipher(algorithms.AES(value_key), modes.CBC(iv), backend=default_backend())
-    encryptor = cipher.encryptor()
-
-    padder = padding.PKCS7(128).padder()
-    padded_data = padder.update(value.encode()) + padder.finalize()
+    nonce = secrets.token_bytes(12)  # Random per value (CSPRNG)
 
-    encrypted = encryptor.update(padded_data) + encryptor.finalize()
-    return base64.b64encode(iv + encrypted).decode()
+    encrypted = ChaCha20Poly1305(value_key).encrypt(nonce, value.encode(), original_key_name.encode())
+    return base64.b64encode(nonce + encrypted).decode()
 
-def decrypt_value(encrypted_value: str, key: bytes, original_key_name: str) -> str:
+def decrypt_value(encrypted_value: str, key: bytes, original_key_name: str,
+                  cipher: str = CIPHER_CHACHA20_POLY1305) -> str:
     """
-    Decrypts a base64-encoded ciphertext using AES-CBC with a key derived from
-    both the main key and the original key name.
+    Decrypts a base64-encoded ciphertext with a key derived from both the main
+    key and the original key name.
 
     Args:
-        encrypted_value (str): The base64-encoded ciphertext (with IV).
+        encrypted_value (str): The base64-encoded ciphertext (with nonce/IV).
         key (bytes): The base AES key.
         original_key_name (str): The original key name used during encryption.
+        cipher (str): CIPHER_CHACHA20_POLY1305, or CIPHER_AES_CTR / CIPHER_AES_CBC
+                      for older files.
 
     Returns:
         str: The decrypted plaintext string.
+
+    Raises:
+        ValueError: If a value or its key name was tampered with, or the key is wrong.
     """
     # Derive the same key-specific encryption key used during encryption
     value_key = derive_value_specific_key(key, original_key_name)
     
     data = base64.b64decode(encrypted_value.encode())
+
+    if cipher == CIPHER_CHACHA20_POLY1305:
+        try:
+            return ChaCha20Poly1305(value_key).decrypt(data[:12], data[12:], original_key_name.encode()).decode()
+        except InvalidTag:
+            raise ValueError("Authentication tag mismatch.") from None
+
     iv = data[:16]
     ciphertext = data[16:]
 
-    cipher = Cipher(algorithms.AES(value_key), modes.CBC(iv), backend=default_backend())
-    decryptor = cipher.decryptor()
-    padded_data = decryptor.update(ciphertext) + decryptor.finalize()
+    if cipher == CIPHER_AES_CTR:
+        return _aes_ctr(ciphertext, value_key, iv).decode()
+
+    padded_data = _aes_cbc_decrypt(ciphertext, value_key, iv)
 
-    unpadder = padding.PKCS7(128).unpadder()
-    value = unpadder.update(padded_data) + unpadder.finalize()
+    # Strip PKCS7 padding inline rather than through a padding.PKCS7 unpadder object
+    pad_len = padded_data[-1] if padded_data else 0
+    if not 1 <= pad_len <= 16 or padded_data[-pad_len:] != bytes((pad_len,)) * pad_len:
+        raise ValueError("Invalid padding bytes.")
 
-    return value.decode()
+    return padded_data[:-pad_len].decode()
 
-def generate_file_signature(content: str, key: bytes) -> str:
+def generate_file_signature(content, key: bytes) -> str:
     """
     Generates a signature for the file content using HMAC-SHA256.
     
     This signature helps verify file integrity and detect tampering with the obfuscated file.
     
     Args:
-        content (str): The content to sign.
+        content (str | bytes): The content to sign (str is UTF-8 encoded first).
         key (bytes): The key used for signing.
         
     Returns:
         str: Base64-encoded signature.
     """
-    h = hmac.new(key, content.encode(), hashlib.sha256)
+    if isinstance(content, str):
+        content = content.encode()
+    h = hmac.new(key, content, hashlib.sha256)
     return base64.b64encode(h.digest()).decode()
 
-def obfuscate_env_file(input_file: str, output_file: str, password: str, app_key: str):
+def _dumps(data) -> bytes:
+    """Serialize mapping data to JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+def _loads(data: bytes):
+    """Parse mapping JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def is_packed_file(path: str) -> bool:
+    """Whether an obfuscated file carries its mapping in a header (--embed-mapping)."""
+    with open(path, 'rb') as file:
+        return file.read(len(PACKED_MAGIC)) == PACKED_MAGIC
+
+def obfuscate_env_file(input_file: str, output_file: str, password: str, app_key: str,
+                       cache_kdf: bool = False, embed_mapping: bool = False):
     """
     Obfuscates the key names and encrypts the values of a .env file.
 
@@ -163,126 +361,271 @@ def obfuscate_env_file(input_file: str, output_file: str, password: str, app_key
         output_file (str): Path to save the obfuscated file.
         password (str): Password used to derive encryption key.
         app_key (str): Application key required for additional security.
+        cache_kdf (bool): Cache the derived key on disk (see generate_key).
+        embed_mapping (bool): Write the mapping into a header of the output file
+                              instead of a separate mapping JSON file.
 
     Outputs:
         - Encrypted .env file.
-        - Mapping JSON file to reverse the obfuscation.
+        - Mapping JSON file to reverse the obfuscation (unless embed_mapping).
     """
-    salt = os.urandom(16)  # Generate a unique salt for key derivation
-    key = generate_key(password, app_key, salt)
+    salt = secrets.token_bytes(16)  # Generate a unique salt for key derivation (CSPRNG)
+    key = generate_key(password, app_key, salt, cache=cache_kdf)
     obfuscation_mapping = {}
-    obfuscated_content = ""
-
-    with open(input_file, 'r') as file:
-        lines = file.readlines()
-
-    with open(output_file, 'w') as file:
-        for line in lines:
-            if '=' in line:
-                key_name, value = line.strip().split('=', 1)
-                obfuscated_key = base64.urlsafe_b64encode(key_name.encode()).decode().strip("=")
-                
-                # Now we pass the original key name to bind it to the encryption
-                encrypted_value = encrypt_value(value, key, key_name)
-
-                obfuscation_mapping[obfuscated_key] = key_name
-                output_line = f"{obfuscated_key}={encrypted_value}\n"
-                obfuscated_content += output_line
-                file.write(output_line)
-    
-    # Generate a signature for the obfuscated content
-    file_signature = generate_file_signature(obfuscated_content, key)
-
-    # Save mapping with the salt used for key derivation and file signature
+    # Hot-loop callables bound once instead of looked up per entry
+    _b64 = base64.urlsafe_b64encode
+    _enc = encrypt_value
+
+    def _encrypt_entry(entry):
+        key_name, value = entry
+        obfuscated_key = _b64(key_name.encode()).decode().strip("=")
+        # Now we pass the original key name to bind it to the encryption
+        return obfuscated_key, key_name, _enc(value, key, key_name)
+
+    def _write_batch(batch, executor):
+        # Small batches are not worth the thread hand-off; large ones are spread over
+        # the pool (OpenSSL releases the GIL) and map() keeps the input order.
+        mapper = executor.map if len(batch) >= PARALLEL_MIN_ENTRIES else map
+        _write = dst.write
+        for obfuscated_key, key_name, encrypted_value in mapper(_encrypt_entry, batch):
+            obfuscation_mapping[obfuscated_key] = key_name
+            _write(f"{obfuscated_key}={encrypted_value}\n".encode())
+
+    # Stream in batches: every value is encrypted under its own name-bound key and
+    # nonce and carries its own authentication tag, so neither the input nor the
+    # output is ever held in memory as a whole and no file signature is needed.
+    with ThreadPoolExecutor(max_workers=ENCRYPT_WORKERS) as executor, \
+            open(input_file, 'r', buffering=READ_BUFFER_SIZE) as src, \
+            open(output_file, 'wb', buffering=WRITE_BUFFER_SIZE) as out:
+        # The header needs the complete mapping, so a packed body is staged in memory
+        dst = io.BytesIO() if embed_mapping else out
+        batch = []
+        for line in src:
+            # One partition per line instead of strip() + split() and a list
+            key_name, sep, value = line.partition('=')
+            if sep:
+                key_name = key_name.strip()
+                if key_name.startswith('#'):
+                    continue
+                batch.append((key_name, value.rstrip('\r\n')))
+                if len(batch) >= ENCRYPT_BATCH_SIZE:
+                    _write_batch(batch, executor)
+                    batch = []
+        _write_batch(batch, executor)
+
+        if embed_mapping:
+            map_json = _dumps({"mapping": obfuscation_mapping, "cipher": CIPHER_CHACHA20_POLY1305})
+            out.write(_PACKED_HEADER.pack(PACKED_MAGIC, PACKED_VERSION, salt, len(map_json)))
+            out.write(map_json)
+            out.write(dst.getbuffer())
+
+    if embed_mapping:
+        print(f"✅ Obfuscated file saved as: {output_file}")
+        print(f"🧩 Mapping embedded in the file header")
+        print(f"🔑 File protected with application key and password")
+        return
+
+    # Save mapping with the salt used for key derivation
     mapping_file = f"{output_file}.mapping.json"
-    with open(mapping_file, 'w') as file:
-        json.dump({
-            "salt": base64.b64encode(salt).decode(), 
-            "mapping": obfuscation_mapping,
-            "signature": file_signature
-        }, file)
+    mapping_data = {
+        "salt": base64.b64encode(salt).decode(), 
+        "mapping": obfuscation_mapping,
+        "cipher": CIPHER_CHACHA20_POLY1305
+    }
+    with open(mapping_file, 'wb') as file:
+        file.write(_dumps(mapping_data))
 
     print(f"✅ Obfuscated file saved as: {output_file}")
     print(f"🧩 Mapping file saved as: {mapping_file}")
     print(f"🔑 File protected with application key and password")
 
-def deobfuscate_env_file(input_file: str, mapping_file: str, output_file: str, password: str, app_key: str):
+def deobfuscate_env_file(input_file: str, mapping_file: str, output_file: str, password: str, app_key: str,
+                         cache_kdf: bool = False):
     """
     Decrypts and restores the original key-value pairs from an obfuscated .env file.
 
     Args:
         input_file (str): Path to the obfuscated .env file.
-        mapping_file (str): Path to the JSON mapping file.
+        mapping_file (str): Path to the JSON mapping file; may be None for files
+                            written with embed_mapping.
         output_file (str): Path to save the restored .env file.
         password (str): Password used to derive the encryption key.
         app_key (str): Application key required for additional security.
+        cache_kdf (bool): Cache the derived key on disk (see generate_key).
     """
-    with open(mapping_file, 'r') as file:
-        mapping_data = json.load(file)
+    # Read the file once: the same bytes are verified and then decrypted
+    with open(input_file, 'rb') as file:
+        raw = file.read()
+
+    body_start = 0
+    if raw.startswith(PACKED_MAGIC):
+        # Mapping and salt come from the header; the sidecar file is not needed
+        _, version, salt, map_len = _PACKED_HEADER.unpack_from(raw)
+        if version != PACKED_VERSION:
+            raise ValueError(f"Unsupported obfuscated file version: {version}")
+        map_start = _PACKED_HEADER.size
+        mapping_data = _loads(raw[map_start:map_start + map_len])
+        body_start = map_start + map_len
+    elif mapping_file is None:
+        raise ValueError("A mapping file is required for files without an embedded mapping.")
+    else:
+        with open(mapping_file, 'rb') as file:
+            mapping_data = _loads(file.read())
         salt = base64.b64decode(mapping_data["salt"].encode())
-        obfuscation_mapping = mapping_data["mapping"]
-        stored_signature = mapping_data.get("signature")
 
-    key = generate_key(password, app_key, salt)
+    obfuscation_mapping = mapping_data["mapping"]
+    stored_signature = mapping_data.get("signature")
+    cipher = mapping_data.get("cipher", CIPHER_AES_CBC)
+
+    key = generate_key(password, app_key, salt, cache=cache_kdf)
 
-    # Read and verify file signature if available
+    # Verify the file signature written by the older AES formats (constant-time comparison)
     if stored_signature:
-        with open(input_file, 'r') as file:
-            content = file.read()
-        
-        calculated_signature = generate_file_signature(content, key)
-        if calculated_signature != stored_signature:
+        calculated_signature = generate_file_signature(raw, key)
+        if not hmac.compare_digest(calculated_signature, stored_signature):
             print("⚠️ WARNING: File signature verification failed. The file may have been tampered with.")
             print("   Proceeding with decryption, but results may be compromised.")
     
-    with open(input_file, 'r') as file:
-        lines = file.readlines()
-
-    with open(output_file, 'w') as file:
-        for line in lines:
-            if '=' in line:
-                obfuscated_key, encrypted_value = line.strip().split('=', 1)
-                original_key = obfuscation_mapping.get(obfuscated_key)
+    with open(output_file, 'w', buffering=WRITE_BUFFER_SIZE) as dst:
+        # Hot-loop callables bound once instead of looked up per line
+        _lookup, _write, _dec = obfuscation_mapping.get, dst.write, decrypt_value
+        # Lines are taken one at a time from a view of the bytes already read, rather
+        # than decoding the whole file and splitting it into a list up front, so
+        # decryption adds no per-file copies on top of the single read buffer.
+        body = io.BytesIO(raw)
+        body.seek(body_start)
+        for raw_line in body:
+            obfuscated_key, sep, encrypted_value = raw_line.decode().partition('=')
+            if sep:
+                encrypted_value = encrypted_value.rstrip()
+                original_key = _lookup(obfuscated_key)
                 
                 if not original_key:
                     print(f"❌ Unknown key: '{obfuscated_key}' not found in mapping")
-                    file.write(f"# UNKNOWN KEY: {obfuscated_key}\n")
+                    _write(f"# UNKNOWN KEY: {obfuscated_key}\n")
                     continue
                 
                 try:
                     # Pass the original key name during decryption
-                    decrypted_value = decrypt_value(encrypted_value, key, original_key)
-                    file.write(f"{original_key}={decrypted_value}\n")
+                    decrypted_value = _dec(encrypted_value, key, original_key, cipher)
+                    _write(f"{original_key}={decrypted_value}\n")
                 except Exception as e:
                     print(f"❌ Error decrypting value for key '{original_key}': {str(e)}")
                     print("   This may indicate tampering with the mapping file or incorrect application key.")
                     # Write the error as a comment in the file to indicate the issue
-                    file.write(f"# ERROR decrypting {original_key}: Possible tampering or wrong app key\n")
+                    _write(f"# ERROR decrypting {original_key}: Possible tampering or wrong app key\n")
 
     print(f"🔓 Deobfuscated file saved as: {output_file}")
 
+HELP = """usage: obfuscator_env.py -i INPUT -p PASSWORD -a APP_KEY [-o OUTPUT] [-d] [-m MAPPING] [--cache-kdf]
+                         [--embed-mapping]
+
+🔐 Obfuscate and encrypt .env files
+
+options:
+  -h, --help            show this help message and exit
+  -i, --input INPUT     Input .env file
+  -o, --output OUTPUT   Output file name (optional)
+  -p, --password PASSWORD
+                        Password for encryption
+  -a, --app-key APP_KEY
+                        Application key for additional security
+  -d, --decrypt         Enable to decrypt instead of encrypt
+  -m, --mapping MAPPING
+                        Mapping file for decryption (required with -d unless
+                        the mapping is embedded in the input file)
+  --cache-kdf           Cache the derived key on disk so repeated runs on the same
+                        file skip Scrypt (weakens protection against disk access)
+  --embed-mapping       Store the mapping in the obfuscated file's header instead
+                        of a separate mapping file
+"""
+
+# option -> (destination, takes a value)
+_OPTIONS = {
+    "-i": ("input", True), "--input": ("input", True),
+    "-o": ("output", True), "--output": ("output", True),
+    "-p": ("password", True), "--password": ("password", True),
+    "-a": ("app_key", True), "--app-key": ("app_key", True),
+    "-d": ("decrypt", False), "--decrypt": ("decrypt", False),
+    "-m": ("mapping", True), "--mapping": ("mapping", True),
+    "--cache-kdf": ("cache_kdf", False),
+    "--embed-mapping": ("embed_mapping", False),
+}
+_REQUIRED = (("input", "-i/--input"), ("password", "-p/--password"), ("app_key", "-a/--app-key"))
+
+def _usage_error(message: str):
+    """Print the usage line and an error to stderr and exit with status 2, like argparse."""
+    sys.stderr.write(f"{HELP.splitlines()[0]}\nobfuscator_env.py: error: {message}\n")
+    sys.exit(2)
+
+def parse_args(argv: list) -> dict:
+    """
+    Parse the command line in a single pass over argv.
+
+    The option set is small and fixed, so this replaces argparse (whose import and
+    parser construction dominate the start-up of short CLI runs). Accepts both
+    "-i value" and "--input=value" forms.
+    """
+    args = {"input": None, "output": None, "password": None,
+            "app_key": None, "decrypt": False, "mapping": None, "cache_kdf": False, "embed_mapping": False}
+    it = iter(argv)
+    for arg in it:
+        if arg in ("-h", "--help"):
+            sys.stdout.write(HELP)
+            sys.exit(0)
+        option, sep, inline_value = arg.partition("=") if arg.startswith("--") else (arg, "", "")
+        if option not in _OPTIONS:
+            _usage_error(f"unrecognized arguments: {arg}")
+        dest, takes_value = _OPTIONS[option]
+        if not takes_value:
+            if sep:
+                _usage_error(f"argument {option}: ignored explicit argument '{inline_value}'")
+            args[dest] = True
+        elif sep:
+            args[dest] = inline_value
+        else:
+            value = next(it, None)
+            if value is None:
+                _usage_error(f"argument {option}: expected one argument")
+            args[dest] = value
+    missing = [flag for dest, flag in _REQUIRED if args[dest] is None]
+    if missing:
+        _usage_error(f"the following arguments are required: {', '.join(missing)}")
+    return args
+
+def run(args: dict) -> dict:
+    """
+    Run an obfuscation or deobfuscation job from parsed arguments (see parse_args).
+
+    Used by main() and by callers that import this module instead of spawning it.
+
+    Returns:
+        dict: The files written, as {"output_file": path[, "mapping_file": path]}.
+    """
+    if args["decrypt"]:
+        output_file = args["output"] if args["output"] else args["input"].replace(f".{DEFAULT_OUTPUT_EXTENSION}", "")
+        deobfuscate_env_file(args["input"], args["mapping"], output_file, args["password"], args["app_key"],
+                             cache_kdf=args["cache_kdf"])
+        return {"output_file": output_file}
+
+    output_file = args["output"] if args["output"] else f"{args['input']}.{DEFAULT_OUTPUT_EXTENSION}"
+    obfuscate_env_file(args["input"], output_file, args["password"], args["app_key"],
+                       cache_kdf=args["cache_kdf"], embed_mapping=args["embed_mapping"])
+    files = {"output_file": output_file}
+    if not args["embed_mapping"]:
+        files["mapping_file"] = f"{output_file}.mapping.json"
+    return files
+
 def main():
     """
     Command-line interface for the script. Supports both encryption (obfuscation) and decryption.
     """
-    parser = argparse.ArgumentParser(description="🔐 Obfuscate and encrypt .env files")
-    parser.add_argument("-i", "--input", required=True, help="Input .env file")
-    parser.add_argument("-o", "--output", help="Output file name (optional)")
-    parser.add_argument("-p", "--password", required=True, help="Password for encryption")
-    parser.add_argument("-a", "--app-key", required=True, help="Application key for additional security")
-    parser.add_argument("-d", "--decrypt", action="store_true", help="Enable to decrypt instead of encrypt")
-    parser.add_argument("-m", "--mapping", help="Mapping file for decryption (required with -d)")
-
-    args = parser.parse_args()
-
-    if args.decrypt:
-        if not args.mapping:
-            parser.error("❌ Mapping file is required for decryption.")
-        output_file = args.output if args.output else args.input.replace(f".{DEFAULT_OUTPUT_EXTENSION}", "")
-        deobfuscate_env_file(args.input, args.mapping, output_file, args.password, args.app_key)
-    else:
-        output_file = args.output if args.output else f"{args.input}.{DEFAULT_OUTPUT_EXTENSION}"
-        obfuscate_env_file(args.input, output_file, args.password, args.app_key)
+    args = parse_args(sys.argv[1:])
+
+    if args["decrypt"] and not args["mapping"] and not is_packed_file(args["input"]):
+        _usage_error("❌ Mapping file is required for decryption.")
+
+    run(args)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -9,8 +9,51 @@ Date: April 12, 2025
 """
 
 import os
+import re
+import asyncio
 import logging
-from typing import List, Optional, Any, Callable
+from functools import lru_cache
+from typing import List, Optional, Any, Awaitable, Callable, Iterable
+
+# Library module: only a named logger with a NullHandler; handlers are set up
+# by the application entrypoint (core.logger.setup_logging)
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Database identifiers: <db_type>.<db_name>
+_DB_ID_RE = re.compile(r'^[^.]+\.[^.]+$')
+
+# Constant leading argv per operation (per-call values are appended); operations
+# toggled by a bool map to an (off, on) pair indexed with that bool
+_ARGS = {
+    "provision": ("-p",),
+    "clear": ("-C", "-d"),
+    "backup": ("-b", "-d"),
+    "restore": ("-r", "-d"),
+    "delete": ("-D", "-d"),
+    "help": ("-h",),
+    "validate": ("--validate",),
+    "drift_check": ("--drift-check", "-d"),
+    "rotate_secrets": ("--rotate-secrets", "-d"),
+    "mask_data": ("--mask-data", "-d"),
+    "simulate_dr": ("--simulate-dr", "-d"),
+    "doc_schema": ("--doc-schema", "-d"),
+    "tag_env": ("--tag-env", "--env"),
+    "trigger_alert": ("--trigger-alert", "-d"),
+    "sandbox": ("--sandbox", "-d"),
+    "rbac": (("--rbac", "--disable", "-d"), ("--rbac", "--enable", "-d")),
+    "retention_policy": ("--retention-policy", "--days"),
+    "check_cost": ("--check-cost", "-d"),
+    "test_auth_policy": ("--test-auth-policy", "-d"),
+    "lint": (("--lint-all",), ("--lint-all", "--ci")),
+    "plan_schema": ("--plan-schema", "-d"),
+    "apply_schema": ("--apply-schema", "-d"),
+}
+
+@lru_cache(maxsize=512)
+def _is_valid_db_id(database_id: str) -> bool:
+    """Check a database identifier against _DB_ID_RE; repeated IDs are a cache hit."""
+    return _DB_ID_RE.match(database_id) is not None
 
 
 class _DatabaseScript:
@@ -21,55 +64,94 @@ class _DatabaseScript:
     with proper parameter validation, error handling, and logging.
     """
     
+    # Upper bound on concurrent script runs started by run_many()
+    MAX_CONCURRENCY = 4
+    
     def __init__(self, run_sh: Callable, verbose: bool = False):
         """
         Initialize the DatabaseScript wrapper.
         
         Args:
-            run_sh: Function to execute the script with provided arguments
-            verbose: Enable verbose logging (default: False)
+            run_sh: Coroutine function executing the script with the provided argv sequence
+            verbose: Enable DEBUG logging for this module unless its logger level is already configured (default: False)
         """
         # Store the provided run_sh function
         self.run_sh = run_sh
         self.verbose = verbose
         
-        # Configure logging
-        log_level = logging.DEBUG if verbose else logging.INFO
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        self.logger = logging.getLogger('DatabaseManagement')
+        # Handlers, format and levels come from the application's logging setup;
+        # verbose only applies while no level has been configured for this module
+        self.logger = logger
+        if verbose and logger.level == logging.NOTSET:
+            logger.setLevel(logging.DEBUG)
         
         self.logger.info("DatabaseScript initialized")
     
+    def _validate_db_id(self, database_id: str) -> bool:
+        """
+        Validate a database identifier, logging an error if it is malformed.
+        
+        Args:
+            database_id: Database identifier in format <db_type>.<db_name>
+            
+        Returns:
+            True if valid, False otherwise
+        """
+        if _is_valid_db_id(database_id):
+            return True
+        self.logger.error("Invalid database ID format: %s. Expected format: <db_type>.<db_name>", database_id)
+        return False
+    
     # Helper method to properly format and execute commands
-    def _execute(self, args: List[str]) -> Any:
+    async def _execute(self, *args: str) -> Any:
         """
-        Format and execute the command with the provided arguments.
+        Execute the command with the provided arguments.
         
         Args:
-            args: List of command-line arguments
+            *args: Command-line arguments, passed through as argv
             
         Returns:
             Result from the run_sh function
         """
-        # Convert argument list to a single string with proper spacing
-        cmd_str = ' '.join(args)
-        
-        self.logger.debug(f"Executing: {cmd_str}")
+        # Skip building the command line entirely unless DEBUG is on
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Executing: %s", ' '.join(args))
         
         try:
             # Execute the command using the provided run_sh function
-            result = self.run_sh([cmd_str])
+            result = await self.run_sh(args)
             return result
         except Exception as e:
-            self.logger.error(f"Exception running command: {str(e)}")
+            self.logger.error("Exception running command: %s", e)
             raise
     
+    async def run_many(self, operations: Iterable[Awaitable]) -> List[Any]:
+        """
+        Run a burst of independent operations concurrently.
+        
+        Each operation is a call to one of this class's methods (not yet awaited);
+        at most MAX_CONCURRENCY script runs are in flight at once, so N independent
+        operations take about as long as the slowest few instead of their sum.
+        
+        Args:
+            operations: Un-awaited method calls, e.g.
+                        (db.backup_database(db_id, path) for db_id in ids)
+        
+        Returns:
+            Results in the order the operations were given; an operation that
+            raised contributes its exception instead of a result
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        
+        async def _bounded(operation: Awaitable) -> Any:
+            async with semaphore:
+                return await operation
+        
+        return await asyncio.gather(*(_bounded(op) for op in operations), return_exceptions=True)
+    
     # Basic Operations
     
-    def provision_databases(self, config_file: Optional[str] = None) -> bool:
+    async def provision_databases(self, config_file: Optional[str] = None) -> bool:
         """
         Provision databases from configuration file.
         
@@ -79,22 +161,15 @@ class _DatabaseScript:
         Returns:
             True if successful, False otherwise
         """
-        args = []
-        
-        # Add custom config file if provided
+        # Execute and return result (assuming run_sh returns success/failure)
         if config_file:
-            args.extend(["-c", config_file])
-        
-        # Add provision flag
-        args.append("-p")
+            self.logger.info("Provisioning databases with config %s", config_file)
+            return await self._execute("-c", config_file, *_ARGS["provision"])
         
-        self.logger.info(f"Provisioning databases" + 
-                         (f" with config {config_file}" if config_file else ""))
-        
-        # Execute and return result (assuming run_sh returns success/failure)
-        return self._execute(args)
+        self.logger.info("Provisioning databases")
+        return await self._execute(*_ARGS["provision"])
     
-    def clear_data(self, database_id: str) -> bool:
+    async def clear_data(self, database_id: str) -> bool:
         """
         Clear data from a specific database.
         
@@ -105,17 +180,14 @@ class _DatabaseScript:
             True if successful, False otherwise
         """
         # Validate database identifier format
-        if '.' not in database_id:
-            self.logger.error(f"Invalid database ID format: {database_id}. Expected format: <db_type>.<db_name>")
+        if not self._validate_db_id(database_id):
             return False
         
-        args = ["-C", "-d", database_id]
+        self.logger.info("Clearing data from database: %s", database_id)
         
-        self.logger.info(f"Clearing data from database: {database_id}")
-        
-        return self._execute(args)
+        return await self._execute(*_ARGS["clear"], database_id)
     
-    def backup_database(self, database_id: str, backup_path: str) -> bool:
+    async def backup_database(self, database_id: str, backup_path: str) -> bool:
         """
         Backup a database to the specified path.
         
@@ -127,23 +199,20 @@ class _DatabaseScript:
             True if successful, False otherwise
         """
         # Validate database identifier format
-        if '.' not in database_id:
-            self.logger.error(f"Invalid database ID format: {database_id}. Expected format: <db_type>.<db_name>")
+        if not self._validate_db_id(database_id):
             return False
         
         # Create directory for backup if it doesn't exist
         backup_dir = os.path.dirname(backup_path)
-        if backup_dir and not os.path.exists(backup_dir):
-            os.makedirs(backup_dir)
-            self.logger.debug(f"Created backup directory: {backup_dir}")
-        
-        args = ["-b", "-d", database_id, backup_path]
+        if backup_dir:
+            os.makedirs(backup_dir, exist_ok=True)
+            self.logger.debug("Ensured backup directory exists: %s", backup_dir)
         
-        self.logger.info(f"Backing up database {database_id} to {backup_path}")
+        self.logger.info("Backing up database %s to %s", database_id, backup_path)
         
-        return self._execute(args)
+        return await self._execute(*_ARGS["backup"], database_id, backup_path)
     
-    def restore_database(self, database_id: str, backup_path: str) -> bool:
+    async def restore_database(self, database_id: str, backup_path: str) -> bool:
         """
         Restore a database from a backup file.
         
@@ -155,22 +224,19 @@ class _DatabaseScript:
             True if successful, False otherwise
         """
         # Validate database identifier format
-        if '.' not in database_id:
-            self.logger.error(f"Invalid database ID format: {database_id}. Expected format: <db_type>.<db_name>")
+        if not self._validate_db_id(database_id):
             return False
         
         # Check if backup file exists
         if not os.path.isfile(backup_path):
-            self.logger.error(f"Backup file not found: {backup_path}")
+            self.logger.error("Backup file not found: %s", backup_path)
             return False
         
-        args = ["-r", "-d", database_id, backup_path]
-        
-        self.logger.info(f"Restoring database {database_id} from {backup_path}")
+        self.logger.info("Restoring database %s from %s", database_id, backup_path)
         
-        return self._execute(args)
+        return await self._execute(*_ARGS["restore"], database_id, backup_path)
     
-    def delete_database(self, database_id: str) -> bool:
+    async def delete_database(self, database_id: str) -> bool:
         """
         Delete a database.
         
@@ -181,45 +247,38 @@ class _DatabaseScript:
             True if successful, False otherwise
         """
         # Validate database identifier format
-        if '.' not in database_id:
-            self.logger.error(f"Invalid database ID format: {database_id}. Expected format: <db_type>.<db_name>")
+        if not self._validate_db_id(database_id):
             return False
         
-        args = ["-D", "-d", database_id]
+        self.logger.info("Deleting database: %s", database_id)
         
-        self.logger.info(f"Deleting database: {database_id}")
-        
-        return self._execute(args)
+        return await self._execute(*_ARGS["delete"], database_id)
     
-    def show_help(self) -> Any:
+    async def show_help(self) -> Any:
         """
         Display help information from the script.
         
         Returns:
             Help text as returned by run_sh
         """
-        args = ["-h"]
-        
         self.logger.info("Displaying script help")
         
-        return self._execute(args)
+        return await self._execute(*_ARGS["help"])
     
     # Extended Operations
     
-    def validate_config(self) -> bool:
+    async def validate_config(self) -> bool:
         """
         Validate the configuration file.
         
         Returns:
             True if valid, False otherwise
         """
-        args = ["--validate"]
-        
         self.logger.info("Validating configuration file")
         
-        return self._execute(args)
+        return await self._execute(*_ARGS["validate"])
     
-    def check_schema_drift(self, database_id: str) -> Any:
+    async def check_schema_drift(self, database_id: str) -> Any:
         """
         Detect schema drift for a database.
         
@@ -230,17 +289,14 @@ class _DatabaseScript:
             Result from run_sh
         """
         # Validate database identifier format
-        if '.' not in database_id:
-            self.logger.error(f"Invalid database ID format: {database_id}. Expected format: <db_type>.<db_name>")
+        if not self._validate_db_id(database_id):
             return False
         
-        args = ["--drift-check", "-d", database_id]
+        self.logger.info("Checking schema drift for database: %s", database_id)
         
-        self.logger.info(f"Checking schema drift for database: {database_id}")
-        
-        return self._execute(args)
+        return await self._execute(*_ARGS["drift_check"], database_id)
     
-    def rotate_secrets(self, database_id: str) -> bool:
+    async def rotate_secrets(self, database_id: str) -> bool:
         """
         Rotate secrets for a database.
         
@@ -251,17 +307,14 @@ class _DatabaseScript:
             True if successful, False otherwise
         """
         # Validate database identifier format
-        if '.' not in database_id:
-            self.logger.error(f"Invalid database ID format: {database_id}. Expected format: <db_type>.<db_name>")
+        if not self._validate_db_id(database_id):
             return False
         
-        args = ["--rotate-secrets", "-d", database_id]
-        
-        self.logger.info(f"Rotating secrets for database: {database_id}")
+        self.logger.info("Rotating secrets for database: %s", database_id)
         
-        return self._execute(args)
+        return await self._execute(*_ARGS["rotate_secrets"], database_id)
     
-    def mask_production_data(self, database_id: str, target_env: str) -> bool:
+    async def mask_production_data(self, database_id: str, target_env: str) -> bool:
         """
         Mask production data for use in another environment.
         
@@ -273,17 +326,14 @@ class _DatabaseScript:
             True if successful, False otherwise
         """
         # Validate database identifier format
-        if '.' not in database_id:
-            self.logger.error(f"Invalid database ID format: {database_id}. Expected format: <db_type>.<db_name>")
+        if not self._validate_db_id(database_id):
             return False
         
-        args = ["--mask-data", "-d", database_id, "--target-env", target_env]
-        
-        self.logger.info(f"Masking production data for database {database_id} for use in {target_env}")
+        self.logger.info("Masking production data for database %s for use in %s", database_id, target_env)
         
-        return self._execute(args)
+        return await self._execute(*_ARGS["mask_data"], database_id, "--target-env", target_env)
     
-    def simulate_disaster_recovery(self, database_id: str) -> Any:
+    async def simulate_disaster_recovery(self, database_id: str) -> Any:
         """
         Simulate disaster recovery for a database.
         
@@ -294,17 +344,14 @@ class _DatabaseScript:
             Result from run_sh
         """
         # Validate database identifier format
-        if '.' not in database_id:
-            self.logger.error(f"Invalid database ID format: {database_id}. Expected format: <db_type>.<db_name>")
+        if not self._validate_db_id(database_id):
             return False
         
-        args = ["--simulate-dr", "-d", database_id]
+        self.logger.info("Simulating disaster recovery for database: %s", database_id)
         
-        self.logger.info(f"Simulating disaster recovery for database: {database_id}")
-        
-        return self._execute(args)
+        return await self._execute(*_ARGS["simulate_dr"], database_id)
     
-    def generate_schema_documentation(self, database_id: str, output_path: str) -> bool:
+    async def generate_schema_documentation(self, database_id: str, output_path: str) -> bool:
         """
         Generate schema documentation for a database.
         
@@ -316,23 +363,20 @@ class _DatabaseScript:
             True if successful, False otherwise
         """
         # Validate database identifier format
-        if '.' not in database_id:
-            self.logger.error(f"Invalid database ID format: {database_id}. Expected format: <db_type>.<db_name>")
+        if not self._validate_db_id(database_id):
             return False
         
         # Create output directory if it doesn't exist
         output_dir = os.path.dirname(output_path)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-            self.logger.debug(f"Created output directory: {output_dir}")
-        
-        args = ["--doc-schema", "-d", database_id, "--output", output_path]
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            self.logger.debug("Ensured output directory exists: %s", output_dir)
         
-        self.logger.info(f"Generating schema documentation for {database_id} to {output_path}")
+        self.logger.info("Generating schema documentation for %s to %s", database_id, output_path)
         
-        return self._execute(args)
+        return await self._execute(*_ARGS["doc_schema"], database_id, "--output", output_path)
     
-    def tag_environment(self, env: str) -> bool:
+    async def tag_environment(self, env: str) -> bool:
         """
         Tag the current environment.
         
@@ -342,13 +386,11 @@ class _DatabaseScript:
         Returns:
             True if successful, False otherwise
         """
-        args = ["--tag-env", "--env", env]
+        self.logger.info("Tagging environment as: %s", env)
         
-        self.logger.info(f"Tagging environment as: {env}")
-        
-        return self._execute(args)
+        return await self._execute(*_ARGS["tag_env"], env)
     
-    def trigger_alert_test(self, database_id: str, scenario: str) -> bool:
+    async def trigger_alert_test(self, database_id: str, scenario: str) -> bool:
         """
         Trigger a monitoring alert test for a database.
         
@@ -360,17 +402,14 @@ class _DatabaseScript:
             True if successful, False otherwise
         """
         # Validate database identifier format
-        if '.' not in database_id:
-            self.logger.error(f"Invalid database ID format: {database_id}. Expected format: <db_type>.<db_name>")
+        if not self._validate_db_id(database_id):
             return False
         
-        args = ["--trigger-alert", "-d", database_id, "--scenario", scenario]
-        
-        self.logger.info(f"Triggering alert test for database {database_id} with scenario {scenario}")
+        self.logger.info("Triggering alert test for database %s with scenario %s", database_id, scenario)
         
-        return self._execute(args)
+        return await self._execute(*_ARGS["trigger_alert"], database_id, "--scenario", scenario)
     
-    def create_sandbox(self, database_id: str, ttl: str) -> bool:
+    async def create_sandbox(self, database_id: str, ttl: str) -> bool:
         """
         Create a sandbox database for testing.
         
@@ -382,17 +421,14 @@ class _DatabaseScript:
             True if successful, False otherwise
         """
         # Validate database identifier format
-        if '.' not in database_id:
-            self.logger.error(f"Invalid database ID format: {database_id}. Expected format: <db_type>.<db_name>")
+        if not self._validate_db_id(database_id):
             return False
         
-        args = ["--sandbox", "-d", database_id, "--ttl", ttl]
+        self.logger.info("Creating sandbox for database %s with TTL %s", database_id, ttl)
         
-        self.logger.info(f"Creating sandbox for database {database_id} with TTL {ttl}")
-        
-        return self._execute(args)
+        return await self._execute(*_ARGS["sandbox"], database_id, "--ttl", ttl)
     
-    def manage_rbac(self, database_id: str, enable: bool) -> bool:
+    async def manage_rbac(self, database_id: str, enable: bool) -> bool:
         """
         Enable or disable RBAC for a database.
         
@@ -404,18 +440,14 @@ class _DatabaseScript:
             True if successful, False otherwise
         """
         # Validate database identifier format
-        if '.' not in database_id:
-            self.logger.error(f"Invalid database ID format: {database_id}. Expected format: <db_type>.<db_name>")
+        if not self._validate_db_id(database_id):
             return False
         
-        args = ["--rbac", "--enable" if enable else "--disable", "-d", database_id]
-        
-        action = "Enabling" if enable else "Disabling"
-        self.logger.info(f"{action} RBAC for database: {database_id}")
+        self.logger.info("%s RBAC for database: %s", "Enabling" if enable else "Disabling", database_id)
         
-        return self._execute(args)
+        return await self._execute(*_ARGS["rbac"][enable], database_id)
     
-    def apply_retention_policy(self, database_id: str, days: int) -> bool:
+    async def apply_retention_policy(self, database_id: str, days: int) -> bool:
         """
         Apply a data retention policy to a database.
         
@@ -427,17 +459,14 @@ class _DatabaseScript:
             True if successful, False otherwise
         """
         # Validate database identifier format
-        if '.' not in database_id:
-            self.logger.error(f"Invalid database ID format: {database_id}. Expected format: <db_type>.<db_name>")
+        if not self._validate_db_id(database_id):
             return False
         
-        args = ["--retention-policy", "--days", str(days), "-d", database_id]
-        
-        self.logger.info(f"Applying {days}-day retention policy to database: {database_id}")
+        self.logger.info("Applying %s-day retention policy to database: %s", days, database_id)
         
-        return self._execute(args)
+        return await self._execute(*_ARGS["retention_policy"], str(days), "-d", database_id)
     
-    def check_cost_estimates(self, database_id: str) -> Any:
+    async def check_cost_estimates(self, database_id: str) -> Any:
         """
         Check cost estimates for a database.
         
@@ -448,17 +477,14 @@ class _DatabaseScript:
             Result from run_sh
         """
         # Validate database identifier format
-        if '.' not in database_id:
-            self.logger.error(f"Invalid database ID format: {database_id}. Expected format: <db_type>.<db_name>")
+        if not self._validate_db_id(database_id):
             return False
         
-        args = ["--check-cost", "-d", database_id]
+        self.logger.info("Checking cost estimates for database: %s", database_id)
         
-        self.logger.info(f"Checking cost estimates for database: {database_id}")
-        
-        return self._execute(args)
+        return await self._execute(*_ARGS["check_cost"], database_id)
     
-    def test_auth_policy(self, database_id: str) -> Any:
+    async def test_auth_policy(self, database_id: str) -> Any:
         """
         Test authentication policy for a database.
         
@@ -469,17 +495,14 @@ class _DatabaseScript:
             Result from run_sh
         """
         # Validate database identifier format
-        if '.' not in database_id:
-            self.logger.error(f"Invalid database ID format: {database_id}. Expected format: <db_type>.<db_name>")
+        if not self._validate_db_id(database_id):
             return False
         
-        args = ["--test-auth-policy", "-d", database_id]
-        
-        self.logger.info(f"Testing auth policy for database: {database_id}")
+        self.logger.info("Testing auth policy for database: %s", database_id)
         
-        return self._execute(args)
+        return await self._execute(*_ARGS["test_auth_policy"], database_id)
     
-    def lint_all_configs(self, ci_mode: bool = False) -> bool:
+    async def lint_all_configs(self, ci_mode: bool = False) -> bool:
         """
         Lint all configuration files.
         
@@ -489,16 +512,14 @@ class _DatabaseScript:
         Returns:
             True if all configs are valid, False otherwise
         """
-        args = ["--lint-all"]
-        
         if ci_mode:
-            args.append("--ci")
+            self.logger.info("Linting all configurations in CI mode")
+        else:
+            self.logger.info("Linting all configurations")
         
-        self.logger.info(f"Linting all configurations" + (" in CI mode" if ci_mode else ""))
-        
-        return self._execute(args)
+        return await self._execute(*_ARGS["lint"][ci_mode])
     
-    def plan_schema_changes(self, database_id: str) -> Any:
+    async def plan_schema_changes(self, database_id: str) -> Any:
         """
         Plan schema changes for a database (dry run).
         
@@ -509,17 +530,14 @@ class _DatabaseScript:
             Result from run_sh
         """
         # Validate database identifier format
-        if '.' not in database_id:
-            self.logger.error(f"Invalid database ID format: {database_id}. Expected format: <db_type>.<db_name>")
+        if not self._validate_db_id(database_id):
             return False
         
-        args = ["--plan-schema", "-d", database_id]
-        
-        self.logger.info(f"Planning schema changes for database: {database_id}")
+        self.logger.info("Planning schema changes for database: %s", database_id)
         
-        return self._execute(args)
+        return await self._execute(*_ARGS["plan_schema"], database_id)
     
-    def apply_schema_changes(self, database_id: str) -> bool:
+    async def apply_schema_changes(self, database_id: str) -> bool:
         """
         Apply approved schema changes to a database.
         
@@ -530,18 +548,15 @@ class _DatabaseScript:
             True if successful, False otherwise
         """
         # Validate database identifier format
-        if '.' not in database_id:
-            self.logger.error(f"Invalid database ID format: {database_id}. Expected format: <db_type>.<db_name>")
+        if not self._validate_db_id(database_id):
             return False
         
-        args = ["--apply-schema", "-d", database_id]
-        
-        self.logger.info(f"Applying schema changes to database: {database_id}")
+        self.logger.info("Applying schema changes to database: %s", database_id)
         
-        return self._execute(args)
+        return await self._execute(*_ARGS["apply_schema"], database_id)
 
-def _run_sh(args_list):
+async def _run_sh(args_list):
         from core.utils.scripts import run_db_mng
-        return run_db_mng(args=args_list)
+        return await run_db_mng(args=args_list)
     
 db_mng_control = _DatabaseScript(run_sh=_run_sh, verbose=True)
@@ -1,8 +1,8 @@
-from pydantic import  AnyHttpUrl
-# from pydantic.settings import BaseSettings # type: ignore
+from pydantic import AnyHttpUrl
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List, Optional
 
-class Settings():
+class Settings(BaseSettings):
     PROJECT_NAME: str = "ICaht BK Api"
     PROJECT_DESCRIPTION: str = ""
     VERSION: str = "0.1.0"
@@ -13,8 +13,15 @@ class Settings():
     
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
     
-    class Config:
-        case_sensitive = True
-        env_file = ".env"
+    model_config = SettingsConfigDict(case_sensitive=True, env_file=".env")
 
-settings = Settings()
\ No newline at end of file
+_settings: Optional[Settings] = None
+
+def __getattr__(name: str):
+    # PEP 562: build `settings` on first access instead of at import time
+    global _settings
+    if name == "settings":
+        if _settings is None:
+            _settings = Settings()
+        return _settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,16 +1,81 @@
 import yaml
 import os
 import sys
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import logging
+from types import MappingProxyType
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger('db_manager')
 
+# Shared read-only default for intermediate lookups in nested config traversals
+_EMPTY = MappingProxyType({})
+
+def _get_storage(config: Dict) -> Dict:
+    """Return the 'storage' section of the configuration."""
+    return config.get('storage', _EMPTY)
+
+# Configuration Index Functions
+def _intern(name):
+    """Intern string keys parsed from the config; other key types pass through."""
+    return sys.intern(name) if type(name) is str else name
+
+def build_config_index(config: Dict) -> Dict:
+    """
+    Build lookup tables over the storage section so per-database helpers
+    resolve in O(1) instead of scanning every engine.
+    
+    When a database name is defined under several engines, the first engine
+    in configuration order wins, matching the previous linear scan.
+    
+    Args:
+        config: Configuration dictionary
+        
+    Returns:
+        Dictionary with 'db_to_engine', 'db_configs', 'locations',
+        'locations_by_engine' and 'users_by_db_username' tables
+    """
+    db_to_engine = {}
+    db_configs = {}
+    locations = {}
+    locations_by_engine = {}
+    for engine, engine_data in _get_storage(config).items():
+        # Interned names turn the `engine == 'neo4j'` style comparisons in the
+        # helpers below into pointer checks
+        engine = _intern(engine)
+        for db_name, db_config in engine_data.get('databases', _EMPTY).items():
+            db_name = _intern(db_name)
+            if db_name not in db_to_engine:
+                db_to_engine[db_name] = engine
+                db_configs[db_name] = db_config
+        eng_locations = locations_by_engine[engine] = []
+        for loc_name, loc_config in engine_data.get('locations', _EMPTY).items():
+            locations[(engine, loc_name)] = loc_config
+            # Skip non-dictionary values like admin credentials
+            if type(loc_config) is dict:
+                eng_locations.append((loc_name, loc_config))
+    users_by_db_username = {}
+    for db_name, db_config in db_configs.items():
+        for user in db_config.get('users', ()):
+            # setdefault keeps the first match, like the former list scan
+            users_by_db_username.setdefault((db_name, user.get('username')), user)
+    return {
+        'db_to_engine': db_to_engine,
+        'db_configs': db_configs,
+        'locations': locations,
+        'locations_by_engine': locations_by_engine,
+        'users_by_db_username': users_by_db_username
+    }
+
+def _get_index(config: Dict) -> Dict:
+    """
+    Return the index attached by load_config, building and attaching one if
+    absent (e.g. a config restored from the init cache) so it is built only once.
+    """
+    index = config.get('_index')
+    if index is None:
+        index = config['_index'] = build_config_index(config)
+    return index
+
 # Database System Detection Functions
 def get_supported_db_engines(config: Dict) -> List[str]:
     """
@@ -22,7 +87,7 @@ def get_supported_db_engines(config: Dict) -> List[str]:
     Returns:
         List of database engine names
     """
-    return list(config.get('storage', {}).keys())
+    return list(_get_storage(config).keys())
 
 def get_databases_by_engine(config: Dict, engine: str) -> Dict:
     """
@@ -35,7 +100,25 @@ def get_databases_by_engine(config: Dict, engine: str) -> Dict:
     Returns:
         Dictionary of databases for the specified engine
     """
-    return config.get('storage', {}).get(engine, {}).get('databases', {})
+    return _get_storage(config).get(engine, _EMPTY).get('databases', {})
+
+def _iter_databases(config: Dict) -> Iterator[Tuple[str, str, Dict, Optional[Dict]]]:
+    """
+    Walk the storage section once, yielding every database with its location.
+    
+    Args:
+        config: Configuration dictionary
+        
+    Yields:
+        Tuples of (engine, db_name, db_config, location_config); location_config
+        is None when the database has no resolvable location
+    """
+    for engine, engine_data in _get_storage(config).items():
+        eng_locations = engine_data.get('locations', _EMPTY)
+        for db_name, db_config in engine_data.get('databases', _EMPTY).items():
+            location_name = db_config.get('location')
+            location = eng_locations.get(location_name) if location_name else None
+            yield engine, db_name, db_config, location
 
 def get_all_databases(config: Dict) -> Dict[str, Dict]:
     """
@@ -47,14 +130,15 @@ def get_all_databases(config: Dict) -> Dict[str, Dict]:
     Returns:
         Dictionary mapping database names to their configurations
     """
-    all_dbs = {}
-    for engine in get_supported_db_engines(config):
-        for db_name, db_config in get_databases_by_engine(config, engine).items():
-            all_dbs[db_name] = {
-                'engine': engine,
-                'config': db_config
-            }
-    return all_dbs
+    # Direct comprehension: skips _iter_databases' per-db location lookup
+    return {
+        db_name: {
+            'engine': engine,
+            'config': db_config
+        }
+        for engine, engine_data in _get_storage(config).items()
+        for db_name, db_config in engine_data.get('databases', _EMPTY).items()
+    }
 
 def get_database_engine(config: Dict, db_name: str) -> Optional[str]:
     """
@@ -67,10 +151,7 @@ def get_database_engine(config: Dict, db_name: str) -> Optional[str]:
     Returns:
         Engine name or None if not found
     """
-    for engine in get_supported_db_engines(config):
-        if db_name in get_databases_by_engine(config, engine):
-            return engine
-    return None
+    return _get_index(config)['db_to_engine'].get(db_name)
 
 # Location Management Functions
 def get_db_location(config: Dict, db_name: str) -> Optional[str]:
@@ -84,11 +165,10 @@ def get_db_location(config: Dict, db_name: str) -> Optional[str]:
     Returns:
         Location name or None if not found
     """
-    engine = get_database_engine(config, db_name)
-    if not engine:
+    db_config = _get_index(config)['db_configs'].get(db_name)
+    if db_config is None:
         return None
     
-    db_config = get_databases_by_engine(config, engine).get(db_name, {})
     return db_config.get('location')
 
 def get_location_config(config: Dict, engine: str, location_name: str) -> Optional[Dict]:
@@ -103,7 +183,8 @@ def get_location_config(config: Dict, engine: str, location_name: str) -> Option
     Returns:
         Location configuration or None if not found
     """
-    return config.get('storage', {}).get(engine, {}).get('locations', {}).get(location_name)
+    eng = _get_storage(config).get(engine)
+    return (eng or _EMPTY).get('locations', _EMPTY).get(location_name)
 
 def get_all_locations(config: Dict, engine: str = None) -> Dict:
     """
@@ -116,19 +197,27 @@ def get_all_locations(config: Dict, engine: str = None) -> Dict:
     Returns:
         Dictionary mapping location names to their configurations
     """
-    locations = {}
-    engines = [engine] if engine else get_supported_db_engines(config)
-    
-    for eng in engines:
-        eng_locations = config.get('storage', {}).get(eng, {}).get('locations', {})
-        for loc_name, loc_config in eng_locations.items():
-            if isinstance(loc_config, dict):  # Skip non-dictionary values like admin credentials
-                locations[f"{eng}:{loc_name}"] = {
-                    'engine': eng,
-                    'name': loc_name,
-                    'config': loc_config
-                }
-    return locations
+    locations_by_engine = _get_index(config)['locations_by_engine']
+    engines = [engine] if engine else locations_by_engine
+    
+    return {
+        f"{eng}:{loc_name}": {
+            'engine': eng,
+            'name': loc_name,
+            'config': loc_config
+        }
+        for eng in engines
+        for loc_name, loc_config in locations_by_engine.get(eng, ())
+    }
+
+# Location-level credential fields copied into connection info, per engine
+_ENGINE_CONN_FIELDS = {
+    'postgres': ('admin', 'admin_password'),
+    'mariadb': ('admin', 'admin_password'),
+    'mongodb': ('admin', 'admin_password'),
+    'redis': ('admin_password',),
+    'influxdb': ('admin_token',),
+}
 
 def get_connection_info(config: Dict, db_name: str) -> Optional[Dict]:
     """
@@ -141,17 +230,18 @@ def get_connection_info(config: Dict, db_name: str) -> Optional[Dict]:
     Returns:
         Connection information dictionary or None if not found
     """
-    engine = get_database_engine(config, db_name)
+    index = _get_index(config)
+    engine = index['db_to_engine'].get(db_name)
     if not engine:
         return None
     
-    db_config = get_databases_by_engine(config, engine).get(db_name, {})
+    db_config = index['db_configs'][db_name]
     location_name = db_config.get('location')
     
     if not location_name:
         return None
     
-    location = get_location_config(config, engine, location_name)
+    location = index['locations'].get((engine, location_name))
     if not location:
         return None
     
@@ -164,31 +254,14 @@ def get_connection_info(config: Dict, db_name: str) -> Optional[Dict]:
     }
     
     # Add engine-specific admin credentials
-    if engine == 'postgres' or engine == 'mariadb':
-        connection_info.update({
-            'admin': location.get('admin'),
-            'admin_password': location.get('admin_password')
-        })
-    elif engine == 'mongodb':
-        connection_info.update({
-            'admin': location.get('admin'),
-            'admin_password': location.get('admin_password')
-        })
-    elif engine == 'redis':
-        connection_info.update({
-            'admin_password': location.get('admin_password')
-        })
-    elif engine == 'influxdb':
-        connection_info.update({
-            'admin_token': location.get('admin_token')
-        })
-    elif engine == 'neo4j':
+    if engine == 'neo4j':
         # Neo4j has admin credentials at the engine level
-        admin_creds = {
-            'admin': config.get('storage', {}).get('neo4j', {}).get('locations', {}).get('admin'),
-            'admin_password': config.get('storage', {}).get('neo4j', {}).get('locations', {}).get('admin_password')
-        }
-        connection_info.update(admin_creds)
+        neo4j_locations = _get_storage(config).get('neo4j', _EMPTY).get('locations', _EMPTY)
+        connection_info['admin'] = neo4j_locations.get('admin')
+        connection_info['admin_password'] = neo4j_locations.get('admin_password')
+    else:
+        for field in _ENGINE_CONN_FIELDS.get(engine, ()):
+            connection_info[field] = location.get(field)
     
     return connection_info
 
@@ -204,11 +277,10 @@ def list_db_users(config: Dict, db_name: str) -> List[Dict]:
     Returns:
         List of user configurations
     """
-    engine = get_database_engine(config, db_name)
-    if not engine:
+    db_config = _get_index(config)['db_configs'].get(db_name)
+    if db_config is None:
         return []
     
-    db_config = get_databases_by_engine(config, engine).get(db_name, {})
     return db_config.get('users', [])
 
 def get_user_info(config: Dict, db_name: str, username: str) -> Optional[Dict]:
@@ -223,11 +295,7 @@ def get_user_info(config: Dict, db_name: str, username: str) -> Optional[Dict]:
     Returns:
         User configuration or None if not found
     """
-    users = list_db_users(config, db_name)
-    for user in users:
-        if user.get('username') == username:
-            return user
-    return None
+    return _get_index(config)['users_by_db_username'].get((db_name, username))
 
 def get_all_users(config: Dict) -> Dict:
     """
@@ -239,23 +307,16 @@ def get_all_users(config: Dict) -> Dict:
     Returns:
         Dictionary mapping user identifiers to their configurations
     """
-    all_users = {}
-    all_dbs = get_all_databases(config)
-    
-    for db_name, db_info in all_dbs.items():
-        engine = db_info['engine']
-        users = list_db_users(config, db_name)
-        
-        for user in users:
-            username = user.get('username', 'anonymous')
-            user_id = f"{engine}:{db_name}:{username}"
-            all_users[user_id] = {
-                'engine': engine,
-                'database': db_name,
-                'config': user
-            }
-    
-    return all_users
+    return {
+        f"{engine}:{db_name}:{user.get('username', 'anonymous')}": {
+            'engine': engine,
+            'database': db_name,
+            'config': user
+        }
+        for engine, engine_data in _get_storage(config).items()
+        for db_name, db_config in engine_data.get('databases', _EMPTY).items()
+        for user in db_config.get('users', ())
+    }
 
 # Scaling Configuration Functions
 def get_scaling_config(config: Dict, db_name: str) -> Optional[Dict]:
@@ -269,17 +330,18 @@ def get_scaling_config(config: Dict, db_name: str) -> Optional[Dict]:
     Returns:
         Scaling configuration or None if not found
     """
-    engine = get_database_engine(config, db_name)
+    index = _get_index(config)
+    engine = index['db_to_engine'].get(db_name)
     if not engine:
         return None
     
-    db_config = get_databases_by_engine(config, engine).get(db_name, {})
+    db_config = index['db_configs'][db_name]
     location_name = db_config.get('location')
     
     if not location_name:
         return None
     
-    location = get_location_config(config, engine, location_name)
+    location = index['locations'].get((engine, location_name))
     if not location:
         return None
     
@@ -296,10 +358,9 @@ def get_autoscaling_databases(config: Dict) -> List[str]:
         List of database names with autoscaling enabled
     """
     autoscaling_dbs = []
-    all_dbs = get_all_databases(config)
     
-    for db_name in all_dbs:
-        scaling = get_scaling_config(config, db_name)
+    for _, db_name, _, location in _iter_databases(config):
+        scaling = location.get('scaling') if location else None
         if scaling and scaling.get('auto_scaling'):
             autoscaling_dbs.append(db_name)
     
@@ -321,7 +382,7 @@ def get_database_controls(config: Dict, db_name: str) -> List[Dict]:
     if not engine:
         return []
     
-    return config.get('storage', {}).get(engine, {}).get('controls', [])
+    return _get_storage(config).get(engine, _EMPTY).get('controls', [])
 
 def get_migration_file_location(config: Dict, db_name: str) -> Optional[str]:
     """
@@ -366,9 +427,9 @@ def get_environment_controls(config: Dict, environment: str = None) -> Dict:
         Dictionary of environment-specific controls
     """
     if not environment:
-        environment = config.get('metadata', {}).get('environment', 'development')
+        environment = config.get('metadata', _EMPTY).get('environment', 'development')
     
-    return config.get('environments', {}).get(environment, {}).get('controls', {})
+    return config.get('environments', _EMPTY).get(environment, _EMPTY).get('controls', {})
 
 # Environment Functions
 def get_current_environment(config: Dict) -> str:
@@ -381,7 +442,7 @@ def get_current_environment(config: Dict) -> str:
     Returns:
         Current environment name
     """
-    return config.get('metadata', {}).get('environment', 'development')
+    return config.get('metadata', _EMPTY).get('environment', 'development')
 
 def get_backup_schedule(config: Dict, environment: str = None) -> str:
     """
@@ -397,7 +458,7 @@ def get_backup_schedule(config: Dict, environment: str = None) -> str:
     if not environment:
         environment = get_current_environment(config)
     
-    return config.get('environments', {}).get(environment, {}).get('backup_schedule', 'daily')
+    return config.get('environments', _EMPTY).get(environment, _EMPTY).get('backup_schedule', 'daily')
 
 # Database Command Generation Functions
 def get_postgres_connection_string(connection_info: Dict, db_name: str = None, username: str = None, password: str = None) -> str:
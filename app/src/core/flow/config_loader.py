@@ -1,13 +1,34 @@
 import yaml
+import copy
+import hashlib
+import json
+import mmap
 import os
 import sys
-from typing import Dict
+import tempfile
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+
+from .config_impl import build_config_index
+
+# Prefer the libyaml-backed loader (requires the libyaml system library,
+# e.g. `apt install libyaml-dev` before `pip install pyyaml`) and fall back
+# to the pure-Python loader when it is unavailable.
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
 class ConfigStructureError(Exception):
     """Raised when the configuration file is missing required keys or structure."""
     pass
 
+# Sentinel distinguishing absent keys from keys explicitly set to null
+_MISSING = object()
+
 def validate_config_structure(config):
+    # Exact type checks (`type(x) is dict`) are safe here: the YAML and JSON
+    # loaders only ever produce builtin dict/list/str/bool instances.
     # Top-level required keys
     required_top_keys = ['storage', 'controls', 'environments']
     for key in required_top_keys:
@@ -15,60 +36,189 @@ def validate_config_structure(config):
             raise ConfigStructureError(f"Missing top-level key: '{key}' in config.")
 
     # Validate 'storage'
-    if not isinstance(config['storage'], dict):
+    storage = config['storage']
+    if type(storage) is not dict:
         raise ConfigStructureError("'storage' must be a dictionary.")
-    for engine, engine_data in config['storage'].items():
-        if not isinstance(engine_data, dict):
+    for engine, engine_data in storage.items():
+        if type(engine_data) is not dict:
             raise ConfigStructureError(f"'storage.{engine}' must be a dictionary.")
-        if 'databases' not in engine_data:
+        databases = engine_data.get('databases', _MISSING)
+        if databases is _MISSING:
             raise ConfigStructureError(f"'databases' missing in 'storage.{engine}'.")
-        if not isinstance(engine_data['databases'], dict):
+        if type(databases) is not dict:
             raise ConfigStructureError(f"'storage.{engine}.databases' must be a dictionary.")
-        for db_name, db_data in engine_data['databases'].items():
-            if not isinstance(db_data, dict):
+        for db_name, db_data in databases.items():
+            if type(db_data) is not dict:
                 raise ConfigStructureError(f"'storage.{engine}.databases.{db_name}' must be a dictionary.")
-            if 'location' not in db_data:
+            location = db_data.get('location', _MISSING)
+            if location is _MISSING:
                 raise ConfigStructureError(f"'location' missing in 'storage.{engine}.databases.{db_name}'.")
-            if not isinstance(db_data['location'], str):
+            if type(location) is not str:
                 raise ConfigStructureError(f"'location' in 'storage.{engine}.databases.{db_name}' must be a string.")
-            if 'users' in db_data and not isinstance(db_data['users'], list):
+            users = db_data.get('users', _MISSING)
+            if users is not _MISSING and type(users) is not list:
                 raise ConfigStructureError(f"'users' in 'storage.{engine}.databases.{db_name}' must be a list.")
 
-        if 'controls' in engine_data and not isinstance(engine_data['controls'], list):
+        controls = engine_data.get('controls', _MISSING)
+        if controls is not _MISSING and type(controls) is not list:
             raise ConfigStructureError(f"'controls' in 'storage.{engine}' must be a list.")
 
     # Validate 'controls'
-    if not isinstance(config['controls'], dict):
+    controls = config['controls']
+    if type(controls) is not dict:
         raise ConfigStructureError("'controls' must be a dictionary.")
-    for control, control_data in config['controls'].items():
-        if not isinstance(control_data, dict):
+    for control, control_data in controls.items():
+        if type(control_data) is not dict:
             raise ConfigStructureError(f"'controls.{control}' must be a dictionary.")
-        if 'enabled' not in control_data:
+        enabled = control_data.get('enabled', _MISSING)
+        if enabled is _MISSING:
             raise ConfigStructureError(f"'enabled' missing in 'controls.{control}'.")
-        if not isinstance(control_data['enabled'], bool):
+        if type(enabled) is not bool:
             raise ConfigStructureError(f"'enabled' in 'controls.{control}' must be a boolean.")
 
     # Validate 'environments'
-    if not isinstance(config['environments'], dict):
+    environments = config['environments']
+    if type(environments) is not dict:
         raise ConfigStructureError("'environments' must be a dictionary.")
-    for env, env_data in config['environments'].items():
-        if not isinstance(env_data, dict):
+    for env, env_data in environments.items():
+        if type(env_data) is not dict:
             raise ConfigStructureError(f"'environments.{env}' must be a dictionary.")
 
 import logging
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger('db_manager')
 
+# Suffix of the JSON snapshot written next to a parsed YAML configuration
+CONFIG_CACHE_SUFFIX = '.cache.json'
+# Suffix (appended to the cache path) of the source fingerprint guarding the snapshot
+CONFIG_FINGERPRINT_SUFFIX = '.fp'
+# Snapshot format version, mixed into the fingerprint: bump it whenever what the
+# snapshot stores (or the rules for storing it) changes, so snapshots written by
+# older code no longer match. 2: only JSON round-trip-safe configs are cached.
+CONFIG_CACHE_VERSION = 2
+
+def _fingerprint(data) -> str:
+    """Return a short hash of the snapshot format version and the raw YAML bytes (any bytes-like buffer)."""
+    digest = hashlib.blake2b(CONFIG_CACHE_VERSION.to_bytes(2, 'big'), digest_size=16)
+    digest.update(data)
+    return digest.hexdigest()
+
+def _read_config_cache(cache_path: str, fingerprint: str) -> Optional[Dict]:
+    """
+    Return the cached configuration if it was produced from the same YAML bytes.
+    
+    A matching fingerprint means the cached dict already passed
+    validate_config_structure, so callers can skip validation.
+    
+    Args:
+        cache_path: Path to the JSON cache file
+        fingerprint: Fingerprint of the current YAML source bytes
+        
+    Returns:
+        Cached configuration dict or None if missing, stale or unreadable
+    """
+    try:
+        with open(cache_path + CONFIG_FINGERPRINT_SUFFIX, 'r') as file:
+            if file.read().strip() != fingerprint:
+                return None
+        with open(cache_path, 'r') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+def _atomic_write(path: str, write: Callable, fsync: bool = False) -> None:
+    """Write a file through a temporary sibling and os.replace it into place."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as file:
+            write(file)
+            if fsync:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _write_config_cache(cache_path: str, config: Dict, fingerprint: str, fsync: bool = False) -> None:
+    """
+    Atomically write the parsed configuration as JSON next to its source,
+    followed by the fingerprint of the YAML it was parsed from.
+    
+    Configurations that JSON cannot reproduce exactly (non-string keys, dates,
+    sets, ...) are not cached, so a cache hit always yields the same dict a
+    fresh parse would. Failures are logged and ignored; the cache is only an
+    optimization.
+    
+    Args:
+        cache_path: Path to the JSON cache file
+        config: Validated configuration dictionary
+        fingerprint: Fingerprint of the YAML source bytes
+        fsync: Flush the temporary files to disk before replacing the cache
+    """
+    try:
+        serialized = json.dumps(config)
+        lossless = json.loads(serialized) == config
+    except (TypeError, ValueError):
+        lossless = False
+    if not lossless:
+        logger.info(f"Configuration {cache_path} does not round-trip through JSON; not caching it")
+        return
+    try:
+        _atomic_write(cache_path, lambda file: file.write(serialized), fsync)
+        # Written last so a fingerprint match always implies a complete JSON cache
+        _atomic_write(cache_path + CONFIG_FINGERPRINT_SUFFIX, lambda file: file.write(fingerprint), fsync)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not write configuration cache {cache_path}: {e}")
+
 # Configuration Functions
+@lru_cache(maxsize=4)
+def _parse(path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Parse, validate and index a configuration file.
+    
+    Memoized per process on (path, mtime_ns, size), so an edited file is
+    picked up without any manual invalidation.
+    
+    Args:
+        path: Absolute path to the YAML configuration file
+        mtime_ns: Modification time of the file, part of the memo key
+        size: Size of the file in bytes, part of the memo key
+        
+    Returns:
+        Dict containing the configuration (shared; do not mutate)
+    """
+    cache_path = path + CONFIG_CACHE_SUFFIX
+    # Map the file read-only so hashing and parsing scan the page cache
+    # directly instead of copying through Python's text I/O layer
+    with open(path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        fingerprint = _fingerprint(data)
+        config = _read_config_cache(cache_path, fingerprint)
+        if config is not None:
+            logger.info(f"Configuration loaded from cache {cache_path}")
+        else:
+            config = yaml.load(data, Loader=_Loader)
+            validate_config_structure(config)
+            _write_config_cache(cache_path, config, fingerprint)
+        logger.info(f"Configuration loaded from {path}")
+        
+    # Attached after caching: the index is derived data and not JSON-serializable
+    config['_index'] = build_config_index(config)
+    return config
+
 def load_config(config_file: str) -> Dict:
     """
     Load configuration from YAML file.
     
+    A validated JSON snapshot is kept in `<config_file>.cache.json` and reused,
+    without re-validation, while the YAML bytes and the snapshot format version
+    still match the fingerprint stored in `<config_file>.cache.json.fp`. Within
+    a process the parsed file is memoized until its mtime or size changes;
+    every call returns a deep copy so callers are free to mutate it. Call
+    `load_config.cache_clear()` to drop the memo.
+    
     Args:
         config_file: Path to the YAML configuration file
         
@@ -80,14 +230,13 @@ def load_config(config_file: str) -> Dict:
             logger.error(f"Configuration file not found: {config_file}")
             sys.exit(1)
             
-        with open(config_file, 'r') as file:
-            config = yaml.safe_load(file)
-        validate_config_structure(config)
-        logger.info(f"Configuration loaded from {config_file}")
-        return config
+        stat = os.stat(config_file)
+        return copy.deepcopy(_parse(os.path.abspath(config_file), stat.st_mtime_ns, stat.st_size))
     except yaml.YAMLError as e:
         logger.error(f"Error parsing YAML configuration: {e}")
         sys.exit(1)
     except Exception as e:
         logger.error(f"Error loading configuration: {e}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+
+load_config.cache_clear = _parse.cache_clear
@@ -1,7 +1,14 @@
 import logging
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-logger = logging.getLogger("BK_Service")
\ No newline at end of file
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """
+    Configure root logging for the process.
+    
+    Library modules only create named loggers; call this once from the
+    application entrypoint.
+    """
+    logging.basicConfig(level=level, format=LOG_FORMAT)
+
+logger = logging.getLogger("BK_Service")
@@ -0,0 +1,31 @@
+from typing import Any
+
+from fastapi.responses import FileResponse, JSONResponse
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson when it is installed.
+    
+    Behaves exactly like JSONResponse otherwise, so it is safe to use as the
+    application's default response class.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+class LargeFileResponse(FileResponse):
+    """
+    FileResponse reading 1 MiB per chunk instead of Starlette's 64 KiB.
+    
+    Servers implementing the ASGI pathsend extension still get the path and
+    send the file themselves (zero-copy); chunking only applies otherwise.
+    """
+
+    chunk_size = 1 << 20
@@ -1,4 +1,7 @@
 # import fcntl
+import asyncio
+import concurrent.futures
+import functools
 import logging
 import os
 import re
@@ -7,6 +10,7 @@ import shutil
 import subprocess
 import time
 import select
+import selectors
 import sys
 import signal
 import threading
@@ -76,6 +80,41 @@ class ShellExecutionError(Exception):
         # 3. Full integration with Python's exception handling system
         super().__init__(message)
 
+# Threads that launch and wait on subprocesses for execute_command_async
+_spawn_pool = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.getenv("SUBPROCESS_WORKERS", 8)),
+    thread_name_prefix="subproc"
+)
+
+# pidfd_open (Linux 5.3+) lets us sleep until a child exits instead of polling for it
+_HAS_PIDFD = hasattr(os, "pidfd_open")
+
+def _pidfd_wait(pid: int, timeout: Optional[float] = None) -> bool:
+    """
+    Block until a child process exits, without reaping it.
+
+    The process stays a zombie so Popen.poll()/wait() still collect its exit
+    status as usual. Only available where os.pidfd_open exists.
+
+    Args:
+        pid: Process ID to wait for
+        timeout: Maximum time to wait in seconds (None waits forever)
+
+    Returns:
+        True if the process has exited, False if the timeout elapsed first
+    """
+    try:
+        fd = os.pidfd_open(pid)
+    except ProcessLookupError:
+        # Already reaped
+        return True
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            return bool(selector.select(timeout))
+    finally:
+        os.close(fd)
+
 def set_verbosity(level: int) -> None:
     """
     Set the verbosity level for the shell utilities module.
@@ -149,83 +188,6 @@ def normalize_path_for_shell(path: str, target_shell: str = 'auto') -> str:
 
     return norm_path
 
-def prepare_command_for_shell(
-    cmd: str,
-    script_path: str = None,
-    args: list = None,
-    shell_type: str = 'auto',
-    verbose: bool = False
-) -> str:
-    """
-    Prepare a command string for execution in the target shell environment.
-
-    Args:
-        cmd: The command to execute (or None to build from script_path and args)
-        script_path: Path to script file (if cmd is None)
-        args: List of arguments to pass to the script (if cmd is None)
-        shell_type: Target shell ('auto', 'cmd', 'powershell', 'git_bash', 'wsl', 'bash', 'sh')
-        verbose: Whether to log detailed information
-
-    Returns:
-        Prepared command string ready for execution
-    """
-    if cmd is None:
-        if script_path is None:
-            raise ValueError("Either cmd or script_path must be provided")
-        cmd = script_path
-        if args:
-            cmd = f"{script_path} {' '.join(str(arg) for arg in args)}"
-
-    if shell_type == 'auto':
-        if os.name == 'nt':
-            git_bash = r"C:\Program Files\Git\bin\bash.exe"
-            if os.path.exists(git_bash):
-                shell_type = 'git_bash'
-            else:
-                try:
-                    result = subprocess.run(
-                        ["wsl", "echo", "available"],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        timeout=1
-                    )
-                    shell_type = 'wsl' if result.returncode == 0 else 'cmd'
-                except (subprocess.SubprocessError, FileNotFoundError):
-                    pass
-                    # shell_type = 'cmd'
-        else:
-            shell_type = 'bash' if os.path.exists("/bin/bash") or os.path.exists("/usr/bin/bash") else 'sh'
-
-    if verbose:
-        logger.debug(f"Preparing command for shell type: {shell_type}")
-        logger.debug(f"Original command: {cmd}")
-
-    if script_path is None and ' ' in cmd:
-        script_path = cmd.split(' ')[0]
-
-    if shell_type == 'cmd':
-        return cmd
-    elif shell_type == 'powershell':
-        ps_cmd = cmd.replace("'", "''")
-        return f'powershell -Command "{ps_cmd}"'
-    elif shell_type == 'git_bash':
-        git_bash_exe = r"C:\Program Files\Git\bin\bash.exe"
-        if script_path and ':' in script_path:
-            normalized_path = normalize_path_for_shell(script_path, 'git_bash')
-            cmd = cmd.replace(script_path, normalized_path)
-        return f'"{git_bash_exe}" -c "{cmd.replace("\"", "\\\"")}"'
-    elif shell_type == 'wsl':
-        if script_path and ':' in script_path:
-            normalized_path = normalize_path_for_shell(script_path, 'wsl')
-            cmd = cmd.replace(script_path, normalized_path)
-        return f'wsl bash -c "{cmd.replace("\"", "\\\"")}"'
-    elif shell_type == 'bash':
-        return f'bash -c "{cmd.replace("\"", "\\\"")}"'
-    elif shell_type == 'sh':
-        return f'sh -c "{cmd.replace("\"", "\\\"")}"'
-
-    return cmd
-
 def which_shell_available() -> str:
     """
     Detect which shell environments are available on the system.
@@ -387,6 +349,85 @@ def execute_command(
             logger.error(f"Error executing command: {cmd_str}\n{str(e)}")
         raise
 
+async def execute_command_async(
+    cmd: List[str],
+    cwd: Optional[str] = None,
+    env: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+    check: bool = False,
+    encoding: str = 'utf-8',
+    verbose: bool = False
+) -> subprocess.CompletedProcess:
+    """
+    Execute a command without a shell and without blocking the event loop.
+
+    The process is spawned and waited on from a dedicated thread pool
+    (SUBPROCESS_WORKERS threads, default 8) rather than through asyncio's
+    subprocess transport, so a slow fork/exec cannot stall the loop.
+
+    Args:
+        cmd: List of command arguments (argv); the first item is the executable
+        cwd: Working directory for the command
+        env: Environment variables for the command
+        timeout: Maximum execution time in seconds
+        check: Whether to raise an exception if command fails
+        encoding: Character encoding for output
+        verbose: Whether to log detailed information about execution
+
+    Returns:
+        subprocess.CompletedProcess object with execution results
+
+    Raises:
+        ShellExecutionError: If check=True and the command returns non-zero
+        TimeoutExpired: If command execution exceeds timeout
+    """
+    cmd_str = " ".join(cmd)
+    if verbose:
+        logger.info(f"Executing command: {cmd_str}")
+        if cwd:
+            logger.info(f"Working directory: {cwd}")
+        if env:
+            logger.info(f"Environment variables: {env}")
+
+    start_time = time.time()
+    loop = asyncio.get_running_loop()
+    try:
+        # fork/exec and the blocking wait both happen on the spawn pool, never on the loop thread
+        completed = await loop.run_in_executor(_spawn_pool, functools.partial(
+            subprocess.run,
+            cmd,
+            cwd=cwd,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=timeout
+        ))
+    except subprocess.TimeoutExpired:
+        # subprocess.run has already killed and reaped the child
+        if verbose:
+            logger.error(f"Command timed out after {timeout}s: {cmd_str}")
+        raise subprocess.TimeoutExpired(cmd_str, timeout)
+
+    result = subprocess.CompletedProcess(
+        cmd,
+        completed.returncode,
+        completed.stdout.decode(encoding, errors='replace'),
+        completed.stderr.decode(encoding, errors='replace')
+    )
+
+    if verbose:
+        execution_time = time.time() - start_time
+        logger.info(f"Command completed in {execution_time:.2f}s with return code {result.returncode}")
+        if result.stdout:
+            logger.debug(f"STDOUT: {result.stdout.strip()}")
+        if result.stderr:
+            logger.debug(f"STDERR: {result.stderr.strip()}")
+
+    if check and result.returncode != 0:
+        raise ShellExecutionError(cmd_str, result.returncode, result.stdout, result.stderr)
+
+    return result
+
 def execute_with_input(
     cmd: Union[str, List[str]],
     input_data: str,
@@ -501,6 +542,9 @@ def execute_interactive(
     stdout_data = []
     stderr_data = []
     start_time = time.time()
+    # Watching the pidfd too wakes select() as soon as the child exits
+    exit_fd = os.pidfd_open(process.pid) if _HAS_PIDFD else None
+    watched = [process.stdout, process.stderr] + ([exit_fd] if exit_fd is not None else [])
 
     try:
         fcntl.fcntl(process.stdout, fcntl.F_SETFL, os.O_NONBLOCK) # type: ignore
@@ -511,9 +555,11 @@ def execute_interactive(
                 process.kill()
                 raise subprocess.TimeoutExpired(cmd_str, timeout)
 
-            readable, _, _ = select.select([process.stdout, process.stderr], [], [], 0.1)
+            readable, _, _ = select.select(watched, [], [], 0.1)
 
             for stream in readable:
+                if stream is exit_fd:
+                    continue
                 line = stream.readline()
                 if not line:
                     continue
@@ -558,6 +604,9 @@ def execute_interactive(
         if verbose:
             logger.error(f"Error during interactive command: {cmd_str}\n{str(e)}")
         raise
+    finally:
+        if exit_fd is not None:
+            os.close(exit_fd)
 
 def execute_parallel_commands(
     commands: List[Union[str, List[str]]],
@@ -732,7 +781,11 @@ def execute_pipeline(
 
     while last_process.poll() is None:
         _check_timeout()
-        time.sleep(0.1)
+        if _HAS_PIDFD:
+            remaining = timeout - (time.time() - start_time) if timeout else None
+            _pidfd_wait(last_process.pid, max(remaining, 0) if remaining is not None else None)
+        else:
+            time.sleep(0.1)
 
     final_stdout, final_stderr = last_process.communicate()
     if final_stderr:
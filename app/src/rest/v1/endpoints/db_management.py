@@ -1,6 +1,5 @@
-import uuid
 import asyncio
-from fastapi import APIRouter, BackgroundTasks
+from fastapi import APIRouter
 import logging
 # Configure logging
 logging.basicConfig(
@@ -11,7 +10,8 @@ logger = logging.getLogger("BK_DB_Service")
 from pydantic import BaseModel, Field
 from typing import Optional
 from services.storage.local import local_db_controller as db_controller
-from rest.v1.helpers import  TaskResponse,  task_results
+from rest.v1.helpers import TaskResponse, TaskResponseData, submit_task
+from rest.v1._ids import fast_id
 
 class ServiceCommandRequest(BaseModel):
     """Request model for database service commands"""
@@ -29,86 +29,28 @@ class InitializeStackRequest(BaseModel):
 router = APIRouter()
 
 @router.post("/initialize", response_model=TaskResponse)
-async def initialize_stack(request: InitializeStackRequest, background_tasks: BackgroundTasks):
+async def initialize_stack(request: InitializeStackRequest):
     """Initialize the database stack with Terraform"""
-    task_id = str(uuid.uuid4())
+    task_id = fast_id()
     
-    async def _run_task():
-        try:
-            args = ["-i"]
-            if request.root_password:
-                args.append(request.root_password)
-                
-            result = await db_controller.initialize_stack(request.root_password)
-            task_results[task_id] = {
-                "status": "completed",
-                "result": result
-            }
-        except Exception as e:
-            logger.error(f"Task failed: {e}")
-            task_results[task_id] = {
-                "status": "failed",
-                "error": str(e)
-            }
+    submit_task(task_id, db_controller.initialize_stack(request.root_password))
     
-    background_tasks.add_task(_run_task)
-    
-    return {
-        "task_id": task_id,
-        "status": "pending",
-        "message": "Stack initialization started"
-    }
+    return TaskResponseData(task_id, "pending", "Stack initialization started").to_response()
 
 @router.post("/service", response_model=TaskResponse)
-async def manage_service(request: ServiceCommandRequest, background_tasks: BackgroundTasks):
+async def manage_service(request: ServiceCommandRequest):
     """Execute a command on a specific database service"""
-    task_id = str(uuid.uuid4())
-    
-    async def _run_task():
-        try:
-            result = await db_controller.manage_service(request.service, request.command)
-            task_results[task_id] = {
-                "status": "completed",
-                "result": result
-            }
-        except Exception as e:
-            logger.error(f"Task failed: {e}")
-            task_results[task_id] = {
-                "status": "failed",
-                "error": str(e)
-            }
+    task_id = fast_id()
     
-    background_tasks.add_task(_run_task)
+    submit_task(task_id, db_controller.manage_service(request.service, request.command))
     
-    return {
-        "task_id": task_id,
-        "status": "pending",
-        "message": f"Service command '{request.command}' for '{request.service}' started"
-    }
+    return TaskResponseData(task_id, "pending", f"Service command '{request.command}' for '{request.service}' started").to_response()
 
 @router.post("/all", response_model=TaskResponse)
-async def manage_all_services(request: AllServicesCommandRequest, background_tasks: BackgroundTasks):
-    """Execute a command on all database services"""
-    task_id = str(uuid.uuid4())
-    
-    async def _run_task():
-        try:
-            result = await db_controller.manage_all_services(request.command)
-            task_results[task_id] = {
-                "status": "completed",
-                "result": result
-            }
-        except Exception as e:
-            logger.error(f"Task failed: {e}")
-            task_results[task_id] = {
-                "status": "failed",
-                "error": str(e)
-            }
+async def manage_all_services(request: AllServicesCommandRequest):
+    """Execute a command on all database services (backups run concurrently per service)"""
+    task_id = fast_id()
     
-    background_tasks.add_task(_run_task)
+    submit_task(task_id, db_controller.manage_all_services(request.command))
     
-    return {
-        "task_id": task_id,
-        "status": "pending",
-        "message": f"Command '{request.command}' for all services started"
-    }
+    return TaskResponseData(task_id, "pending", f"Command '{request.command}' for all services started").to_response()
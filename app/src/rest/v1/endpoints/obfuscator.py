@@ -1,10 +1,9 @@
 import asyncio
 import os
-import tempfile
 from typing import Optional
 
 # FastAPI imports
-from fastapi import APIRouter, HTTPException, Depends, Query, Body, File, UploadFile, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, Query, Body, File, UploadFile
 from pydantic import BaseModel, Field
 import logging
 # Configure logging
@@ -13,7 +12,9 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger("BK_Obfuscator_Service")
-from rest.v1.helpers import FileUploadResponse, TaskResponse, save_upload_file, task_results, temp_files
+from rest.v1.helpers import FileUploadResponse, FileUploadResponseData, TaskResponse, TaskResponseData, save_upload_file, submit_task, temp_files, UPLOAD_DIR
+from rest.v1._ids import fast_id
+from services.env.obfuscator_service import env_obfuscator
 
 class ObfuscateRequest(BaseModel):
     """Request model for obfuscating an env file"""
@@ -27,6 +28,46 @@ class DeobfuscateRequest(BaseModel):
 
 router = APIRouter()
 
+def _output_path(output_filename: Optional[str]) -> Optional[str]:
+    """Resolve a requested output filename inside the upload directory"""
+    if output_filename:
+        return os.path.join(UPLOAD_DIR, os.path.basename(output_filename))
+    return None
+
+def _track_output(result: dict, file_key: str, id_key: str) -> None:
+    """Register a generated file as a downloadable temp file and record its ID in the result"""
+    if "output_files" in result and file_key in result["output_files"]:
+        file_id = fast_id()
+        path = result["output_files"][file_key]["path"]
+        temp_files[file_id] = {
+            "path": path,
+            "original_filename": os.path.basename(path)
+        }
+        result[id_key] = file_id
+
+async def _obfuscate(input_path: str, password: str, output_filename: Optional[str]) -> dict:
+    """Background job: obfuscate a file and track the generated files"""
+    # The obfuscation (KDF, cipher, file I/O) is synchronous: run it on a worker
+    # thread so it does not block the event loop serving other requests
+    result = await asyncio.to_thread(
+        env_obfuscator.obfuscate, input_path, password, output_file=_output_path(output_filename)
+    )
+    _track_output(result, "output_file", "output_file_id")
+    _track_output(result, "mapping_file", "mapping_file_id")
+    return result
+
+async def _deobfuscate(input_path: str, mapping_path: str, password: str, output_filename: Optional[str]) -> dict:
+    """Background job: deobfuscate a file and track the restored file"""
+    result = await asyncio.to_thread(
+        env_obfuscator.deobfuscate,
+        input_path,
+        mapping_path,
+        password,
+        output_file=_output_path(output_filename)
+    )
+    _track_output(result, "output_file", "output_file_id")
+    return result
+
 @router.post("/env/upload", response_model=FileUploadResponse)
 async def upload_env_file(file: UploadFile = File(...)):
     """Upload an environment file for processing"""
@@ -35,76 +76,26 @@ async def upload_env_file(file: UploadFile = File(...)):
     
     file_id = await save_upload_file(file)
     
-    return {
-        "file_id": file_id,
-        "filename": file.filename,
-        "temp_path": temp_files[file_id]["path"]
-    }
+    return FileUploadResponseData(file_id, file.filename, temp_files[file_id]["path"]).to_response()
 
 @router.post("/env/obfuscate/{file_id}", response_model=TaskResponse)
 async def obfuscate_env_file(
     file_id: str, 
-    request: ObfuscateRequest,
-    background_tasks: BackgroundTasks
+    request: ObfuscateRequest
 ):
     """Obfuscate an uploaded environment file"""
     if file_id not in temp_files:
         raise HTTPException(status_code=404, detail="File not found")
     
-    task_id = str(uuid.uuid4())
+    task_id = fast_id()
     input_path = temp_files[file_id]["path"]
-
-    from services.env.obfuscator_service import env_obfuscator
-    
-    async def _run_task():
-        try:
-            output_path = None
-            if request.output_filename:
-                output_path = os.path.join(tempfile.gettempdir(), request.output_filename)
-                
-            result = env_obfuscator.obfuscate(input_path, request.password, output_path)
-            
-            # Track output files
-            if "output_files" in result and "output_file" in result["output_files"]:
-                output_file_id = str(uuid.uuid4())
-                output_path = result["output_files"]["output_file"]["path"]
-                temp_files[output_file_id] = {
-                    "path": output_path,
-                    "original_filename": os.path.basename(output_path)
-                }
-                result["output_file_id"] = output_file_id
-                
-            if "output_files" in result and "mapping_file" in result["output_files"]:
-                mapping_file_id = str(uuid.uuid4())
-                mapping_path = result["output_files"]["mapping_file"]["path"]
-                temp_files[mapping_file_id] = {
-                    "path": mapping_path,
-                    "original_filename": os.path.basename(mapping_path)
-                }
-                result["mapping_file_id"] = mapping_file_id
-                
-            task_results[task_id] = {
-                "status": "completed",
-                "result": result
-            }
-        except Exception as e:
-            logger.error(f"Task failed: {e}")
-            task_results[task_id] = {
-                "status": "failed",
-                "error": str(e)
-            }
     
-    background_tasks.add_task(_run_task)
+    submit_task(task_id, _obfuscate(input_path, request.password, request.output_filename))
     
-    return {
-        "task_id": task_id,
-        "status": "pending",
-        "message": "File obfuscation started"
-    }
+    return TaskResponseData(task_id, "pending", "File obfuscation started").to_response()
 
 @router.post("/env/deobfuscate", response_model=TaskResponse)
 async def deobfuscate_env_file(
-    background_tasks: BackgroundTasks,
     obfuscated_file_id: str = Query(..., description="ID of the uploaded obfuscated file"),
     mapping_file_id: str = Query(..., description="ID of the uploaded mapping file"),
     request: DeobfuscateRequest = Body(...),    
@@ -115,53 +106,11 @@ async def deobfuscate_env_file(
     if mapping_file_id not in temp_files:
         raise HTTPException(status_code=404, detail="Mapping file not found")
     
-    task_id = str(uuid.uuid4())
+    task_id = fast_id()
     input_path = temp_files[obfuscated_file_id]["path"]
     mapping_path = temp_files[mapping_file_id]["path"]
-
-    from services.env.obfuscator_service import env_obfuscator
-    
-    async def _run_task():
-        try:
-            output_path = None
-            if request.output_filename:
-                output_path = os.path.join(tempfile.gettempdir(), request.output_filename)
-                
-            result = env_obfuscator.deobfuscate(
-                input_path, 
-                mapping_path, 
-                request.password, 
-                output_path
-            )
-            
-            # Track output file
-            if "output_files" in result and "output_file" in result["output_files"]:
-                output_file_id = str(uuid.uuid4())
-                output_path = result["output_files"]["output_file"]["path"]
-                temp_files[output_file_id] = {
-                    "path": output_path,
-                    "original_filename": os.path.basename(output_path)
-                }
-                result["output_file_id"] = output_file_id
-                
-            task_results[task_id] = {
-                "status": "completed",
-                "result": result
-            }
-        except Exception as e:
-            logger.error(f"Task failed: {e}")
-            task_results[task_id] = {
-                "status": "failed",
-                "error": str(e)
-            }
     
-    background_tasks.add_task(_run_task)
+    submit_task(task_id, _deobfuscate(input_path, mapping_path, request.password, request.output_filename))
     
-    return {
-        "task_id": task_id,
-        "status": "pending",
-        "message": "File deobfuscation started"
-    }
+    return TaskResponseData(task_id, "pending", "File deobfuscation started").to_response()
 
-# Add missing imports for the async functionality
-import uuid
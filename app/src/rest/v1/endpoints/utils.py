@@ -1,7 +1,6 @@
 
-import os
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from core.responses import LargeFileResponse
 from rest.v1.helpers import task_results, temp_files
 router = APIRouter()
 
@@ -21,7 +20,7 @@ async def download_file(file_id: str):
         raise HTTPException(status_code=404, detail="File not found")
     
     file_info = temp_files[file_id]
-    return FileResponse(
+    return LargeFileResponse(
         path=file_info["path"],
         filename=file_info["original_filename"],
         media_type="application/octet-stream"
@@ -33,9 +32,8 @@ async def delete_temp_file(file_id: str):
     if file_id not in temp_files:
         raise HTTPException(status_code=404, detail="File not found")
     
-    file_path = temp_files[file_id]["path"]
     try:
-        os.remove(file_path)
+        # Dropping the entry also unlinks the underlying file
         del temp_files[file_id]
         return {"message": "File deleted successfully"}
     except Exception as e:
@@ -1,9 +1,15 @@
 
+import asyncio
 import os
+import shutil
 import tempfile
-from typing import List
-import uuid
-from fastapi import BackgroundTasks, UploadFile
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Dict, List, Optional, Tuple
+import aiofiles.tempfile
+from cachetools import TTLCache
+from fastapi import BackgroundTasks, HTTPException, UploadFile
+from core.responses import FastJSONResponse
 import logging
 # Configure logging
 logging.basicConfig(
@@ -11,6 +17,7 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger("BK_Helpers_Service")
+from rest.v1._ids import fast_id
 from pydantic import BaseModel, Field
 
 
@@ -26,9 +33,135 @@ class FileUploadResponse(BaseModel):
     filename: str = Field(..., description="Original filename")
     temp_path: str = Field(..., description="Temporary storage path")
 
-# In-memory storage for task results and temporary files
-task_results = {}
-temp_files = {}
+# Server-built responses skip pydantic validation: the models above only describe
+# the schema, these slotted dataclasses are what endpoints actually return.
+@dataclass(slots=True)
+class TaskResponseData:
+    """Unvalidated counterpart of TaskResponse"""
+    task_id: str
+    status: str
+    message: str
+
+    def to_response(self) -> FastJSONResponse:
+        return FastJSONResponse({"task_id": self.task_id, "status": self.status, "message": self.message})
+
+@dataclass(slots=True)
+class FileUploadResponseData:
+    """Unvalidated counterpart of FileUploadResponse"""
+    file_id: str
+    filename: str
+    temp_path: str
+
+    def to_response(self) -> FastJSONResponse:
+        return FastJSONResponse({"file_id": self.file_id, "filename": self.filename, "temp_path": self.temp_path})
+
+def _unlink_quietly(file_info: Dict) -> None:
+    """Remove a tracked temporary file, ignoring files that are already gone"""
+    try:
+        os.remove(file_info["path"])
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error(f"Failed to remove temporary file {file_info.get('path')}: {e}")
+
+class TempFileCache(TTLCache):
+    """TTL/LRU cache that deletes the backing file whenever an entry is dropped"""
+
+    def __delitem__(self, key):
+        # Also reached from pop() and LRU eviction via popitem()
+        file_info = self[key]
+        super().__delitem__(key)
+        _unlink_quietly(file_info)
+
+    def expire(self, time=None):
+        # TTLCache.expire drops entries without going through __delitem__
+        expired = super().expire(time)
+        for _, file_info in expired or ():
+            _unlink_quietly(file_info)
+        return expired
+
+# Private directory for uploads and generated files, created once per process
+UPLOAD_DIR = tempfile.mkdtemp(prefix="dataforge_")
+
+def cleanup_upload_dir() -> None:
+    """Remove the upload directory and everything in it (application shutdown)"""
+    shutil.rmtree(UPLOAD_DIR, ignore_errors=True)
+
+# Size of each read when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Bounded in-memory storage for task results and temporary files
+TASK_CACHE_MAX = int(os.getenv("TASK_CACHE_MAX", 10000))
+TASK_TTL_SECS = int(os.getenv("TASK_TTL_SECS", 3600))
+
+task_results: TTLCache = TTLCache(maxsize=TASK_CACHE_MAX, ttl=TASK_TTL_SECS)
+temp_files: TempFileCache = TempFileCache(maxsize=TASK_CACHE_MAX, ttl=TASK_TTL_SECS)
+
+def get_task_results() -> TTLCache:
+    """Return the task result store"""
+    return task_results
+
+def get_temp_files() -> TempFileCache:
+    """Return the temporary file store"""
+    return temp_files
+
+async def run_tracked(task_id: str, awaitable: Awaitable) -> None:
+    """Await a background job and record its outcome in task_results"""
+    try:
+        task_results[task_id] = {
+            "status": "completed",
+            "result": await awaitable
+        }
+    except Exception as e:
+        logger.error(f"Task failed: {e}")
+        task_results[task_id] = {
+            "status": "failed",
+            "error": str(e)
+        }
+
+# Long-lived workers that run submitted tasks off the request path
+TASK_WORKERS = int(os.getenv("DF_WORKERS", 8))
+TASK_QUEUE_MAX = int(os.getenv("DF_TASK_QUEUE_MAX", 1024))
+
+_task_q: Optional[asyncio.Queue[Tuple[str, Awaitable]]] = None
+
+async def _task_worker(queue: asyncio.Queue) -> None:
+    """Run queued tasks one after another until cancelled"""
+    while True:
+        task_id, awaitable = await queue.get()
+        try:
+            await run_tracked(task_id, awaitable)
+        finally:
+            queue.task_done()
+
+@asynccontextmanager
+async def task_workers(count: int = TASK_WORKERS) -> AsyncIterator[None]:
+    """Run the task worker pool for the lifetime of the context (the application's lifespan)"""
+    global _task_q
+    _task_q = asyncio.Queue(maxsize=TASK_QUEUE_MAX)
+    async with asyncio.TaskGroup() as group:
+        workers = [group.create_task(_task_worker(_task_q)) for _ in range(count)]
+        try:
+            yield
+        finally:
+            _task_q = None
+            for worker in workers:
+                worker.cancel()
+
+def submit_task(task_id: str, awaitable: Awaitable) -> None:
+    """
+    Queue a coroutine for the worker pool; its outcome lands in task_results.
+    
+    Raises HTTPException(503) when the workers are not running or the queue is full.
+    """
+    try:
+        if _task_q is None:
+            raise asyncio.QueueFull
+        _task_q.put_nowait((task_id, awaitable))
+    except asyncio.QueueFull:
+        awaitable.close()  # never started; avoid "coroutine was never awaited"
+        logger.warning(f"Rejected task {task_id}: task queue unavailable or full")
+        raise HTTPException(status_code=503, detail="Server busy, try again later")
 
 def cleanup_temp_files(background_tasks: BackgroundTasks, file_ids: List[str]):
     """Schedule cleanup of temporary files"""
@@ -36,7 +169,7 @@ def cleanup_temp_files(background_tasks: BackgroundTasks, file_ids: List[str]):
         for file_id in file_ids:
             if file_id in temp_files:
                 try:
-                    os.remove(temp_files[file_id])
+                    # Removing the entry also unlinks the file
                     del temp_files[file_id]
                     logger.info(f"Cleaned up temporary file: {file_id}")
                 except Exception as e:
@@ -46,13 +179,20 @@ def cleanup_temp_files(background_tasks: BackgroundTasks, file_ids: List[str]):
 
 async def save_upload_file(upload_file: UploadFile) -> str:
     """Save an uploaded file to a temporary location and return its ID"""
-    content = await upload_file.read()
     # Generate a unique ID
-    file_id = f"{uuid.uuid4()}"
-    temp_path = os.path.join(tempfile.gettempdir(), f"{file_id}_{upload_file.filename}")
+    file_id = fast_id()
     
-    with open(temp_path, "wb") as f:
-        f.write(content)
+    # Stream the upload in chunks so large files never sit fully in memory
+    async with aiofiles.tempfile.NamedTemporaryFile(
+        "wb",
+        delete=False,
+        dir=UPLOAD_DIR,
+        prefix=f"{file_id}_",
+        suffix=f"_{os.path.basename(upload_file.filename or '')}",
+    ) as out:
+        temp_path = out.name
+        while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+            await out.write(chunk)
     
     # Track the temporary file
     temp_files[file_id] = {
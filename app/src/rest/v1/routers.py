@@ -3,20 +3,13 @@ from fastapi import APIRouter
 
 api_v1_router = APIRouter()
 
-api_v1_router.include_router(
-    db_management.router,
-    prefix="/db",
-    tags=["DB"]
+# (router, prefix, tag, include_in_schema) for every v1 endpoint module.
+# Internal management groups are left out of the OpenAPI schema.
+_SUBROUTERS = (
+    (db_management.router, "/db", "DB", False),
+    (obfuscator.router, "/sec", "Obfuscator", True),
+    (utils.router, "/fns", "Tasks", True),
 )
 
-api_v1_router.include_router(
-    obfuscator.router,
-    prefix="/sec",
-    tags=["Obfuscator"]
-)
-
-api_v1_router.include_router(
-    utils.router,
-    prefix="/fns",
-    tags=["Tasks"]
-)
\ No newline at end of file
+for router, prefix, tag, in_schema in _SUBROUTERS:
+    api_v1_router.include_router(router, prefix=prefix, tags=[tag], include_in_schema=in_schema)
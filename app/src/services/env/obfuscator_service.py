@@ -35,16 +35,17 @@ Usage Examples:
     )
 """
 
+import importlib.util
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, Optional, Union, List, Callable
 from pathlib import Path
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Library module: only a named logger; handlers/levels are set up by the application
+# entrypoint (core.logger.setup_logging)
 logger = logging.getLogger("EnvObfuscator")
 
 
@@ -99,7 +100,38 @@ class _EnvObfuscator:
         """
         self._run_script = run_script_func
         self._app_key_env_var = app_key_env_var
-        logger.info(f"EnvObfuscator initialized, using {app_key_env_var} for app key")
+        # App key read from the environment, cached after the first lookup
+        self._cached_app_key = None
+        self._app_key_cached = False
+        logger.info("EnvObfuscator initialized, using %s for app key", app_key_env_var)
+    
+    def _get_app_key(self, explicit: Optional[str]) -> Optional[str]:
+        """
+        Resolve the application key to use for a call.
+        
+        Args:
+            explicit: App key passed by the caller; used as-is when not None.
+            
+        Returns:
+            The explicit key, otherwise the value of the app key environment variable
+            (read once found, and cached until invalidate_app_key_cache() is called).
+        """
+        if explicit is not None:
+            return explicit
+        if not self._app_key_cached:
+            self._cached_app_key = os.environ.get(self._app_key_env_var)
+            # A missing key is not cached, so setting the variable later still works
+            self._app_key_cached = bool(self._cached_app_key)
+            logger.debug("Using app key from environment variable %s", self._app_key_env_var)
+        return self._cached_app_key
+    
+    def invalidate_app_key_cache(self) -> None:
+        """
+        Forget the cached app key so the next call re-reads the environment variable
+        (e.g. after the key was rotated, or in tests that change the environment).
+        """
+        self._cached_app_key = None
+        self._app_key_cached = False
     
     def obfuscate(self, 
                   input_file: Union[str, Path], 
@@ -150,8 +182,9 @@ class _EnvObfuscator:
             )
         """
         # Validate inputs
-        input_path = Path(input_file)
-        if not input_path.exists():
+        # Plain string paths and a single stat() per check; no Path objects needed
+        input_path = os.fspath(input_file)
+        if not os.path.isfile(input_path):
             error_msg = f"Input file not found: {input_path}"
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
@@ -162,31 +195,65 @@ class _EnvObfuscator:
             raise ValueError(error_msg)
         
         # Get app key from env var if not provided explicitly
-        effective_app_key = app_key
-        if effective_app_key is None:
-            effective_app_key = os.environ.get(self._app_key_env_var)
-            logger.debug(f"Using app key from environment variable {self._app_key_env_var}")
+        effective_app_key = self._get_app_key(app_key)
             
         if not effective_app_key:
             error_msg = f"Application key not found. Please provide it explicitly or set the {self._app_key_env_var} environment variable."
             logger.error(error_msg)
             raise ValueError(error_msg)
         
-        # Construct command arguments
-        args = ["-i", str(input_path), "-p", password, "-a", effective_app_key]
+        # Construct command arguments (one list literal per case, no extend())
+        output_path = os.fspath(output_file) if output_file else None
+        args = (["-i", input_path, "-p", password, "-a", effective_app_key, "-o", output_path]
+                if output_path else
+                ["-i", input_path, "-p", password, "-a", effective_app_key])
         
-        if output_file:
-            output_path = Path(output_file)
-            args.extend(["-o", str(output_path)])
-            logger.info(f"Obfuscating {input_path} to custom output {output_path}")
+        if output_path:
+            logger.info("Obfuscating %s to custom output %s", input_path, output_path)
         else:
-            logger.info(f"Obfuscating {input_path} with default output naming")
+            logger.info("Obfuscating %s with default output naming", input_path)
         
         # Execute the command
         result = self._run_script(args)
         logger.info("Obfuscation completed successfully")
         return result
     
+    def obfuscate_many(self,
+                       jobs: List[Dict[str, Any]],
+                       max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Obfuscate several environment files concurrently.
+        
+        Each job runs obfuscate() on a worker thread. The cipher and KDF work happens
+        in OpenSSL, which releases the GIL, so files are processed in parallel and
+        one file's reads/writes overlap with another's encryption.
+        
+        Args:
+            jobs: One dict of obfuscate() keyword arguments per file
+                  (input_file, password, and optionally app_key / output_file).
+            max_workers: Maximum number of files processed at once.
+                        Defaults to the number of CPUs.
+        
+        Returns:
+            The obfuscate() result for every job, in the order the jobs were given.
+            
+        Raises:
+            The first exception raised by a job (in job order); the other jobs still run.
+            
+        Example:
+            env_obfuscator.obfuscate_many([
+                {"input_file": "dev/.env", "password": "secure_pass"},
+                {"input_file": "prod/.env", "password": "secure_pass", "output_file": "prod.env.secure"},
+            ])
+        """
+        if not jobs:
+            return []
+        
+        workers = min(len(jobs), max_workers or os.cpu_count() or 1)
+        logger.info("Obfuscating %s files with %s workers", len(jobs), workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="obfuscate") as executor:
+            return list(executor.map(lambda job: self.obfuscate(**job), jobs))
+    
     def deobfuscate(self,
                     input_file: Union[str, Path],
                     mapping_file: Union[str, Path],
@@ -239,15 +306,15 @@ class _EnvObfuscator:
             )
         """
         # Validate inputs
-        input_path = Path(input_file)
-        mapping_path = Path(mapping_file)
+        input_path = os.fspath(input_file)
+        mapping_path = os.fspath(mapping_file)
         
-        if not input_path.exists():
+        if not os.path.isfile(input_path):
             error_msg = f"Obfuscated input file not found: {input_path}"
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
             
-        if not mapping_path.exists():
+        if not os.path.isfile(mapping_path):
             error_msg = f"Mapping file not found: {mapping_path}"
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
@@ -258,37 +325,51 @@ class _EnvObfuscator:
             raise ValueError(error_msg)
         
         # Get app key from env var if not provided explicitly
-        effective_app_key = app_key
-        if effective_app_key is None:
-            effective_app_key = os.environ.get(self._app_key_env_var)
-            logger.debug(f"Using app key from environment variable {self._app_key_env_var}")
+        effective_app_key = self._get_app_key(app_key)
             
         if not effective_app_key:
             error_msg = f"Application key not found. Please provide it explicitly or set the {self._app_key_env_var} environment variable."
             logger.error(error_msg)
             raise ValueError(error_msg)
         
-        # Construct command arguments
-        args = [
-            "-i", str(input_path),
-            "-m", str(mapping_path),
-            "-p", password,
-            "-a", effective_app_key,
-            "-d"  # Deobfuscation flag
-        ]
-        
-        if output_file:
-            output_path = Path(output_file)
-            args.extend(["-o", str(output_path)])
-            logger.info(f"Deobfuscating {input_path} to custom output {output_path}")
+        # Construct command arguments (-d: deobfuscation flag)
+        output_path = os.fspath(output_file) if output_file else None
+        args = (["-i", input_path, "-m", mapping_path, "-p", password, "-a", effective_app_key, "-d", "-o", output_path]
+                if output_path else
+                ["-i", input_path, "-m", mapping_path, "-p", password, "-a", effective_app_key, "-d"])
+        
+        if output_path:
+            logger.info("Deobfuscating %s to custom output %s", input_path, output_path)
         else:
-            logger.info(f"Deobfuscating {input_path} with default output naming")
+            logger.info("Deobfuscating %s with default output naming", input_path)
         
         # Execute the command
         result = self._run_script(args)
         logger.info("Deobfuscation completed successfully")
         return result
     
+    def clear_key_cache(self) -> None:
+        """
+        Drop the derived keys the in-process backend keeps in memory.
+        
+        Deobfuscating the same file again (same password, app key and salt) reuses
+        its Scrypt-derived key instead of re-running the KDF; the keys stay in process
+        memory until evicted or cleared here (e.g. after rotating credentials).
+        """
+        _in_process_backend.clear_key_cache()
+    
+    def warmup(self) -> None:
+        """
+        Pay one-time import costs up front (e.g. from an application startup hook)
+        so the first obfuscation request does not.
+        """
+        from core.utils import scripts  # noqa: F401
+        try:
+            _in_process_backend.load()
+        except (ImportError, OSError) as e:
+            logger.error("Obfuscator script cannot be loaded; obfuscation requests will fail: %s", e)
+        logger.debug("EnvObfuscator warmed up")
+    
     def validate_files(self, 
                        env_file: Union[str, Path], 
                        mapping_file: Optional[Union[str, Path]] = None) -> bool:
@@ -302,16 +383,16 @@ class _EnvObfuscator:
         Returns:
             True if all required files exist, False otherwise.
         """
-        env_path = Path(env_file)
+        env_path = os.fspath(env_file)
         
-        if not env_path.exists():
-            logger.warning(f"Environment file not found: {env_path}")
+        if not os.path.isfile(env_path):
+            logger.warning("Environment file not found: %s", env_path)
             return False
             
         if mapping_file:
-            mapping_path = Path(mapping_file)
-            if not mapping_path.exists():
-                logger.warning(f"Mapping file not found: {mapping_path}")
+            mapping_path = os.fspath(mapping_file)
+            if not os.path.isfile(mapping_path):
+                logger.warning("Mapping file not found: %s", mapping_path)
                 return False
                 
         return True
@@ -329,17 +410,7 @@ class _EnvObfuscator:
         Returns:
             The default output path that would be used if no custom output is specified.
         """
-        path = Path(input_path)
-        
-        if is_deobfuscation:
-            # For deobfuscation, typically removes the .obfuscated suffix if present
-            if path.name.endswith('.obfuscated'):
-                return path.with_name(path.stem)
-            else:
-                return path.with_name(f"{path.name}.deobfuscated")
-        else:
-            # For obfuscation, typically adds .obfuscated suffix
-            return path.with_name(f"{path.name}.obfuscated")
+        return _default_output_path(os.fspath(input_path), is_deobfuscation)
     
     def get_default_mapping_path(self, obfuscated_file: Union[str, Path]) -> Path:
         """
@@ -351,52 +422,115 @@ class _EnvObfuscator:
         Returns:
             The default mapping file path that would be generated during obfuscation.
         """
-        path = Path(obfuscated_file)
-        return path.with_name(f"{path.name}.mapping.json")
-
-def _run_function(args: List[str]) -> Dict[str, Any]:
-        """Example implementation of a function to run the obfuscator_env.py script."""
-        from core.utils.scripts import run_obfuscator_env
-        return run_obfuscator_env(args=args)        
+        return _default_mapping_path(os.fspath(obfuscated_file))
 
-# Create the default instance of the obfuscator
-env_obfuscator = _EnvObfuscator(_run_function)
+# Default paths are purely syntactic, so they are memoized on the (str) input path
+@lru_cache(maxsize=256)
+def _default_output_path(input_path: str, is_deobfuscation: bool) -> Path:
+    """Default output path for get_default_output_path()."""
+    path = Path(input_path)
+    name = path.name
+    
+    if is_deobfuscation:
+        # For deobfuscation, typically removes the .obfuscated suffix if present
+        # (one rpartition gives both the suffix test and the stem)
+        head, sep, tail = name.rpartition('.')
+        if sep and head and tail == 'obfuscated':
+            return path.with_name(head)
+        else:
+            return path.with_name(f"{name}.deobfuscated")
+    else:
+        # For obfuscation, typically adds .obfuscated suffix
+        return path.with_name(f"{name}.obfuscated")
 
-# Usage examples
-"""
-# Example 1: Basic obfuscation using environment variable for app key
-# First, set the environment variable:
-# export OBFUSCATOR_APP_KEY="your_app_key_123"
+@lru_cache(maxsize=256)
+def _default_mapping_path(obfuscated_file: str) -> Path:
+    """Default mapping file path for get_default_mapping_path()."""
+    path = Path(obfuscated_file)
+    return path.with_name(f"{path.name}.mapping.json")
 
-result = env_obfuscator.obfuscate(
-    input_file=".env",
-    password="super_secret_password"
-)
-print(f"Obfuscated file created at: {result['output_file']}")
-print(f"Mapping file created at: {result['mapping_file']}")
+class InProcessObfuscatorBackend:
+    """
+    Runs obfuscator_env.py's functions inside this process instead of spawning the script.
+    
+    Obfuscating a typical .env file takes far less time than starting a new Python
+    interpreter, so calling the script's code directly removes the fork/exec and
+    interpreter start-up from every call. The script is imported from its file, so
+    the CLI and the service share one implementation and one file format, and the
+    cipher work still runs in OpenSSL (AES-NI / ARMv8 crypto where available).
+    """
+    
+    DEFAULT_SCRIPT_PATH = Path(__file__).resolve().parents[3] / "scripts" / "obfuscator_env.py"
+    
+    def __init__(self, script_path: Union[str, Path] = DEFAULT_SCRIPT_PATH):
+        """
+        Args:
+            script_path: Path of the obfuscator_env.py script to import.
+        """
+        self._script_path = os.fspath(script_path)
+        self._module = None
+        self._load_lock = threading.Lock()
+    
+    def load(self):
+        """
+        Import the script module (once).
+        
+        Raises:
+            OSError: If the script file cannot be read.
+            ImportError: If the script or one of its dependencies cannot be imported.
+        """
+        if self._module is None:
+            with self._load_lock:
+                if self._module is None:
+                    spec = importlib.util.spec_from_file_location("obfuscator_env", self._script_path)
+                    if spec is None:
+                        raise ImportError(f"Cannot import obfuscator script: {self._script_path}")
+                    module = importlib.util.module_from_spec(spec)
+                    spec.loader.exec_module(module)
+                    self._module = module
+        return self._module
+    
+    def clear_key_cache(self) -> None:
+        """Clear the script's in-memory derived-key caches, if the script is loaded."""
+        if self._module is not None:
+            self._module.clear_key_cache()
+    
+    def __call__(self, args: List[str]) -> Dict[str, Any]:
+        """
+        Run the script's job for a command line, exactly as the CLI would.
+        
+        Args:
+            args: Script arguments, as passed to obfuscator_env.py.
+            
+        Returns:
+            Dictionary with "returncode" (0) and "output_files", mapping
+            "output_file"/"mapping_file" to {"path": ...} for each file written.
+            
+        Raises:
+            ValueError: If the arguments are not valid for the script.
+        """
+        module = self.load()
+        try:
+            parsed = module.parse_args([str(arg) for arg in args])
+        except SystemExit:
+            raise ValueError("Invalid obfuscator arguments") from None
+        files = module.run(parsed)
+        return {
+            "returncode": 0,
+            "output_files": {name: {"path": path} for name, path in files.items()}
+        }
 
-# Example 2: Obfuscation with explicit app key and custom output
-result = env_obfuscator.obfuscate(
-    input_file=".env",
-    password="super_secret_password",
-    app_key="explicit_app_key_456",
-    output_file="secrets/.env.secure"
-)
+_in_process_backend = InProcessObfuscatorBackend()
 
-# Example 3: Deobfuscation with environment variable for app key
-result = env_obfuscator.deobfuscate(
-    input_file=".env.obfuscated",
-    mapping_file=".env.obfuscated.mapping.json",
-    password="super_secret_password"
-)
-print(f"Deobfuscated file created at: {result['output_file']}")
+def _run_function(args: List[str]) -> Dict[str, Any]:
+        """
+        Run obfuscator_env in-process.
+        
+        There is no subprocess fallback: the script would run on this same
+        interpreter, so an import failure here would fail there too, and its bare
+        return code carries neither the output paths nor error details.
+        """
+        return _in_process_backend(args)
 
-# Example 4: Deobfuscation with custom parameters
-result = env_obfuscator.deobfuscate(
-    input_file="secrets/.env.secure",
-    mapping_file="secrets/.env.secure.mapping.json",
-    password="super_secret_password",
-    app_key="explicit_app_key_456",
-    output_file=".env.restored"
-)
-"""
\ No newline at end of file
+# Create the default instance of the obfuscator
+env_obfuscator = _EnvObfuscator(_run_function)
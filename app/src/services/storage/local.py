@@ -7,23 +7,34 @@ of the original script while providing type hints, thorough documentation, and a
 Pythonic interface.
 """
 
-from typing import List, Optional, Literal, Union, Dict, Any
+from typing import List, Optional, Literal, Union, Dict, Any, Iterable, Tuple
+import asyncio
 import logging
+import time
 from enum import Enum
+from functools import lru_cache
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Library module: only a named logger with a NullHandler; handlers/levels are set up
+# by the application entrypoint (core.logger.setup_logging)
 logger = logging.getLogger("DBController")
+logger.addHandler(logging.NullHandler())
+
+# Whether INFO records are emitted, cached so per-command log calls on hot paths
+# (bulk orchestration) cost one global read when INFO is off. Call
+# refresh_log_levels() after reconfiguring logging.
+_LOG_INFO = logger.isEnabledFor(logging.INFO)
+
+def refresh_log_levels() -> None:
+    """Re-read the logger's effective level into the cached _LOG_INFO flag."""
+    global _LOG_INFO
+    _LOG_INFO = logger.isEnabledFor(logging.INFO)
 
 # Type definitions to enhance code readability and IDE support
 DatabaseType = Literal["postgres", "mariadb", "mongodb", "influxdb", "neo4j", "redis"]
 CommandType = Literal["s", "k", "r", "l", "b", "c", "h", "t"]
 AllCommandType = Literal["s", "k", "t", "b"]
 
-class DatabaseService(Enum):
+class DatabaseService(str, Enum):
     """Enum representing available database services and their command line flags."""
     POSTGRES = "p"
     MARIADB = "m"
@@ -32,7 +43,7 @@ class DatabaseService(Enum):
     NEO4J = "n"
     REDIS = "r"
 
-class DatabaseCommand(Enum):
+class DatabaseCommand(str, Enum):
     """Enum representing available commands for database services."""
     START = "s"
     STOP = "k"
@@ -43,13 +54,44 @@ class DatabaseCommand(Enum):
     HEALTH = "h"
     STATS = "t"
 
-class AllServicesCommand(Enum):
+class AllServicesCommand(str, Enum):
     """Enum representing commands that can be applied to all services at once."""
     START = "s"
     STOP = "k"
     STATUS = "t"
     BACKUP = "b"
 
+# Coercion + validation tables: the enums are str subclasses, so a member hashes and
+# compares equal to its value and one value-keyed dict both converts (to a plain
+# str) and validates (None means invalid) either form. Members are never formatted
+# into strings directly: format() of a str-mixin enum is not its value on 3.12+.
+_SERVICE_COERCE = {s.value: s.value for s in DatabaseService}
+_CMD_COERCE = {c.value: c.value for c in DatabaseCommand}
+_ALL_CMD_COERCE = {c.value: c.value for c in AllServicesCommand}
+
+# Every possible script argv, built once: (flag, cmd) -> ("-<flag>", cmd) and cmd -> ("-a", cmd)
+_ARGV_CACHE = {(s.value, c.value): (f"-{s.value}", c.value) for s in DatabaseService for c in DatabaseCommand}
+_ALL_ARGV_CACHE = {c.value: ("-a", c.value) for c in AllServicesCommand}
+
+@lru_cache(maxsize=128)
+def _resolve(service: Union[DatabaseService, str], command: Union[DatabaseCommand, str]) -> Tuple[str, str]:
+    """
+    Coerce, validate and build the script argv for one service command.
+    
+    Pure in its inputs, so after the first call for a (service, command) pair the
+    whole validation+formatting layer is a single cache lookup.
+    
+    Raises:
+        ValueError: If an invalid service or command is provided.
+    """
+    service_flag = _SERVICE_COERCE.get(service)
+    if service_flag is None:
+        raise ValueError(f"Invalid service flag: {service}")
+    cmd = _CMD_COERCE.get(command)
+    if cmd is None:
+        raise ValueError(f"Invalid command: {command}")
+    return _ARGV_CACHE[service_flag, cmd]
+
 class _DBController:
     """
     A Python class to interact with the dbctl.sh Terraform database stack control script.
@@ -59,20 +101,53 @@ class _DBController:
     individual database services, and performing actions on all services at once.
     """
     
-    def __init__(self, run_command_func: callable):
+    # Fixed per-instance state: slots instead of a per-instance __dict__
+    __slots__ = ("_run_command", "_run_batch", "_health_cache", "_stats_snapshot", "_stats_task")
+    
+    # All-services commands the script runs one service after another; these are
+    # fanned out as concurrent per-service calls instead. Start/stop stay a single
+    # `-a` call since they are one terraform apply/destroy sharing the state lock.
+    FANOUT_COMMANDS = {AllServicesCommand.BACKUP: DatabaseCommand.BACKUP}
+    # Upper bound on concurrent per-service script runs
+    MAX_CONCURRENCY = 4
+    # Seconds a health-check result is reused for repeated polls of the same service
+    HEALTH_TTL = 1.0
+    
+    def __init__(self, run_command_func: callable, run_batch_func: Optional[callable] = None):
         """
         Initialize the DBController with a function to execute the underlying shell script.
         
         Args:
-            run_command_func: A callable that accepts a list of command arguments and
-                              executes the dbctl.sh script with those arguments. This
-                              function should handle the actual command execution and
-                              return the results.
+            run_command_func: A coroutine function that accepts a sequence (list or
+                              tuple) of command arguments and executes the dbctl.sh
+                              script with those arguments. This function should handle the actual command
+                              execution and return the results.
+            run_batch_func: Optional coroutine function used by manage_many() to run
+                            several "-<flag> <cmd>" groups in one script invocation.
+                            Defaults to run_command_func, since dbctl.sh already
+                            processes repeated option groups in order.
         """
         self._run_command = run_command_func
+        self._run_batch = run_batch_func or run_command_func
+        # service flag -> (monotonic timestamp, result) of the last health check
+        self._health_cache: Dict[str, tuple] = {}
+        # (monotonic timestamp, result) of the last all-services status run, and the
+        # background task refreshing it (if one is running)
+        self._stats_snapshot: Optional[tuple] = None
+        self._stats_task: Optional[asyncio.Task] = None
         logger.info("DBController initialized")
         
-    def initialize_stack(self, root_password: Optional[str] = None) -> Dict[str, Any]:
+    def warmup(self) -> None:
+        """
+        Pay one-time import costs up front (e.g. from an application startup hook)
+        so the first service request does not, and pick up the logging levels
+        configured by the application.
+        """
+        _db_ctl_runner()
+        refresh_log_levels()
+        logger.debug("DBController warmed up")
+        
+    async def initialize_stack(self, root_password: Optional[str] = None) -> Dict[str, Any]:
         """
         Initialize the database stack using Terraform.
         
@@ -89,7 +164,8 @@ class _DBController:
         Raises:
             RuntimeError: If the initialization fails.
         """
-        logger.info("Initializing database stack with Terraform")
+        if _LOG_INFO:
+            logger.info("Initializing database stack with Terraform")
         
         # Construct the command arguments
         args = ["-i"]
@@ -98,11 +174,12 @@ class _DBController:
             args.append(root_password)
             
         # Execute the command
-        result = self._run_command(args)
-        logger.info("Stack initialization completed")
+        result = await self._run_command(args)
+        if _LOG_INFO:
+            logger.info("Stack initialization completed")
         return result
     
-    def manage_service(self, 
+    async def manage_service(self, 
                        service: Union[DatabaseService, str], 
                        command: Union[DatabaseCommand, str]) -> Dict[str, Any]:
         """
@@ -123,203 +200,380 @@ class _DBController:
             ValueError: If an invalid service or command is provided.
             RuntimeError: If the command execution fails.
         """
-        # Convert enum values to their string representation if needed
-        service_flag = service.value if isinstance(service, DatabaseService) else service
-        cmd = command.value if isinstance(command, DatabaseCommand) else command
-        
-        # Validate inputs
-        if service_flag not in [s.value for s in DatabaseService]:
-            raise ValueError(f"Invalid service flag: {service_flag}")
-        if cmd not in [c.value for c in DatabaseCommand]:
-            raise ValueError(f"Invalid command: {cmd}")
-            
-        logger.info(f"Managing service with flag '{service_flag}', command '{cmd}'")
+        # Convert enum values to their string representation, validate and build argv
+        argv = _resolve(service, command)
+        if _LOG_INFO:
+            logger.info("Managing service with flag '%s', command '%s'", argv[0][1:], argv[1])
         
         # Execute the command
-        result = self._run_command([f"-{service_flag}", cmd])
-        logger.info(f"Service command executed: -{service_flag} {cmd}")
+        result = await self._run_command(argv)
+        if _LOG_INFO:
+            logger.info("Service command executed: %s %s", *argv)
         return result
     
-    def manage_all_services(self, command: Union[AllServicesCommand, str]) -> Dict[str, Any]:
+    async def manage_many(self,
+                          pairs: Iterable[Tuple[Union[DatabaseService, str],
+                                                Union[DatabaseCommand, str]]]) -> Dict[str, Any]:
         """
-        Execute a command on all database services simultaneously.
+        Execute several service commands with a single script invocation.
         
-        This is equivalent to running dbctl.sh -a [command]
+        This is equivalent to running dbctl.sh -[flag1] [cmd1] -[flag2] [cmd2] ...,
+        which runs the groups one after another in the given order but pays the
+        process start-up (fork/exec and script parsing) only once.
         
         Args:
-            command: The command to execute on all services. Can be either an AllServicesCommand 
-                     enum value or a string representing the command ('s', 'k', 't', 'b').
-                     
+            pairs: (service, command) pairs, each accepted in the same forms as
+                   manage_service().
+                   
         Returns:
-            Dictionary containing the results of the operation.
+            Dictionary containing the results of the operation (the script's exit
+            status reflects the last group).
             
         Raises:
-            ValueError: If an invalid command is provided.
+            ValueError: If any service or command is invalid (nothing is run).
             RuntimeError: If the command execution fails.
-        """
-        # Convert enum value to string if needed
-        cmd = command.value if isinstance(command, AllServicesCommand) else command
-        
-        # Validate input
-        if cmd not in [c.value for c in AllServicesCommand]:
-            raise ValueError(f"Invalid command for all services: {cmd}")
             
-        logger.info(f"Managing all services with command '{cmd}'")
+        Example:
+            # Restart postgres and redis in one go
+            await controller.manage_many([
+                (DatabaseService.POSTGRES, DatabaseCommand.RESTART),
+                (DatabaseService.REDIS, DatabaseCommand.RESTART),
+            ])
+        """
+        args = []
+        for service, command in pairs:
+            args.extend(_resolve(service, command))
         
-        # Execute the command
-        result = self._run_command(["-a", cmd])
-        logger.info(f"All services command executed: -a {cmd}")
+        if not args:
+            raise ValueError("No service commands given")
+        
+        if _LOG_INFO:
+            logger.info("Managing %s service commands in one batch: %s", len(args) // 2, ' '.join(args))
+        result = await self._run_batch(args)
+        if _LOG_INFO:
+            logger.info("Batched service commands executed")
         return result
     
-    # Convenience methods for common operations
-    
-    def start_service(self, service: Union[DatabaseService, str]) -> Dict[str, Any]:
+    def batch(self) -> "_CommandBatch":
         """
-        Start a specific database service.
+        Collect service commands and run them with a single script invocation.
         
-        Args:
-            service: The database service to start.
-                    
-        Returns:
-            Dictionary containing the results of the operation.
-        """
-        logger.info(f"Starting service: {service}")
-        return self.manage_service(service, DatabaseCommand.START)
-    
-    def stop_service(self, service: Union[DatabaseService, str]) -> Dict[str, Any]:
-        """
-        Stop a specific database service.
+        Commands added inside the block are validated as they are added and run
+        together through manage_many() when the block exits normally; nothing is
+        run if the block raises.
         
-        Args:
-            service: The database service to stop.
-                    
         Returns:
-            Dictionary containing the results of the operation.
+            An async context manager yielding the batch; its result attribute holds
+            the manage_many() result once the block has exited.
+            
+        Example:
+            async with controller.batch() as batch:
+                batch.add(DatabaseService.POSTGRES, DatabaseCommand.START)
+                batch.add(DatabaseService.REDIS, DatabaseCommand.START)
+            print(batch.result)
         """
-        logger.info(f"Stopping service: {service}")
-        return self.manage_service(service, DatabaseCommand.STOP)
+        return _CommandBatch(self)
     
-    def restart_service(self, service: Union[DatabaseService, str]) -> Dict[str, Any]:
+    async def manage_all_services(self, command: Union[AllServicesCommand, str]) -> Dict[str, Any]:
         """
-        Restart a specific database service.
+        Execute a command on all database services simultaneously.
+        
+        This is equivalent to running dbctl.sh -a [command]
         
         Args:
-            service: The database service to restart.
-                    
+            command: The command to execute on all services. Can be either an AllServicesCommand 
+                     enum value or a string representing the command ('s', 'k', 't', 'b').
+                     
         Returns:
             Dictionary containing the results of the operation.
+            
+        Raises:
+            ValueError: If an invalid command is provided.
+            RuntimeError: If the command execution fails.
         """
-        logger.info(f"Restarting service: {service}")
-        return self.manage_service(service, DatabaseCommand.RESTART)
+        # Convert enum value to string and validate input
+        cmd = _ALL_CMD_COERCE.get(command)
+        if cmd is None:
+            raise ValueError(f"Invalid command for all services: {command}")
+            
+        if _LOG_INFO:
+            logger.info("Managing all services with command '%s'", cmd)
+        
+        if cmd in self.FANOUT_COMMANDS:
+            return await self._fan_out(self.FANOUT_COMMANDS[cmd])
+        
+        # Execute the command
+        result = await self._run_command(_ALL_ARGV_CACHE[cmd])
+        if _LOG_INFO:
+            logger.info("All services command executed: -a %s", cmd)
+        return result
     
-    def view_logs(self, service: Union[DatabaseService, str]) -> Dict[str, Any]:
+    async def manage_each_service(self, command: Union[DatabaseCommand, str]) -> Dict[DatabaseService, Any]:
         """
-        View logs for a specific database service.
+        Execute a per-service command on every database service concurrently.
+        
+        Unlike manage_all_services(), which runs the script's own "-a" handling, this
+        issues one "-<flag> <cmd>" run per service (at most MAX_CONCURRENCY at a time),
+        so N services take about as long as the slowest one instead of the sum.
         
         Args:
-            service: The database service to view logs for.
-                    
+            command: The command to execute on each service. Can be either a
+                     DatabaseCommand enum value or its command string.
+                     
         Returns:
-            Dictionary containing the logs and results of the operation.
+            Dictionary mapping each DatabaseService to its result, or to the exception
+            its run raised (one failing service does not hide the others' results).
+            
+        Raises:
+            ValueError: If an invalid command is provided.
         """
-        logger.info(f"Viewing logs for service: {service}")
-        return self.manage_service(service, DatabaseCommand.LOGS)
+        cmd = _CMD_COERCE.get(command)
+        if cmd is None:
+            raise ValueError(f"Invalid command: {command}")
+        
+        if _LOG_INFO:
+            logger.info("Managing each service concurrently with command '%s'", cmd)
+        return await self._run_each(cmd)
     
-    def backup_database(self, service: Union[DatabaseService, str]) -> Dict[str, Any]:
-        """
-        Backup a specific database.
+    async def _run_each(self, cmd: str) -> Dict[DatabaseService, Any]:
+        """Run one command per service concurrently; results (or exceptions) in completion order."""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
         
-        Args:
-            service: The database service to backup.
-                    
-        Returns:
-            Dictionary containing the results of the backup operation.
-        """
-        logger.info(f"Backing up database: {service}")
-        return self.manage_service(service, DatabaseCommand.BACKUP)
+        async def _one(service: DatabaseService):
+            async with semaphore:
+                try:
+                    return service, await self._run_command(_ARGV_CACHE[service, cmd])
+                except Exception as e:
+                    logger.error("Command '%s' failed for %s: %s", cmd, service.name, e)
+                    return service, e
+        
+        results = {}
+        for next_done in asyncio.as_completed([_one(s) for s in DatabaseService]):
+            service, result = await next_done
+            results[service] = result
+        return results
     
-    def connect_to_cli(self, service: Union[DatabaseService, str]) -> Dict[str, Any]:
+    async def _fan_out(self, command: DatabaseCommand) -> Any:
         """
-        Connect to the command-line interface of a specific database.
+        Run a per-service command on every service concurrently.
         
         Args:
-            service: The database service to connect to.
-                    
+            command: The command to execute on each service.
+            
         Returns:
-            Dictionary containing the results of the connection operation.
+            The first non-zero result, or the last result when every service succeeded.
+            
+        Raises:
+            Exception: The first error raised by any service, once all have finished.
         """
-        logger.info(f"Connecting to CLI for service: {service}")
-        return self.manage_service(service, DatabaseCommand.CONNECT)
+        by_service = await self._run_each(command.value)
+        # Report in service order regardless of completion order
+        results = [by_service[s] for s in DatabaseService]
+        
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            raise errors[0]
+        
+        if _LOG_INFO:
+            logger.info("All services command executed per service: %s", command.value)
+        return next((r for r in results if r), results[-1])
     
-    def check_health(self, service: Union[DatabaseService, str]) -> Dict[str, Any]:
+    # Convenience methods for common operations
+    # (the per-service shortcuts start_service, stop_service, ... are generated
+    # below the class from _SERVICE_SHORTCUTS)
+    
+    async def check_health(self, service: Union[DatabaseService, str], use_cache: bool = True) -> Dict[str, Any]:
         """
         Check the health status of a specific database service.
         
+        Results are reused for HEALTH_TTL seconds, so pollers (UI, probes) hitting
+        the same service within that window do not each run the script.
+        
         Args:
             service: The database service to check health for.
+            use_cache: Set to False to always run a fresh check (the result still
+                       refreshes the cache).
                     
         Returns:
             Dictionary containing the health information and results of the operation.
         """
-        logger.info(f"Checking health for service: {service}")
-        return self.manage_service(service, DatabaseCommand.HEALTH)
-    
-    def show_statistics(self, service: Union[DatabaseService, str]) -> Dict[str, Any]:
-        """
-        Show statistics for a specific database service.
+        service_flag = _SERVICE_COERCE.get(service)
+        if service_flag is None:
+            raise ValueError(f"Invalid service flag: {service}")
         
-        Args:
-            service: The database service to show statistics for.
-                    
-        Returns:
-            Dictionary containing the statistics and results of the operation.
-        """
-        logger.info(f"Showing statistics for service: {service}")
-        return self.manage_service(service, DatabaseCommand.STATS)
+        if use_cache:
+            cached = self._health_cache.get(service_flag)
+            if cached is not None and time.monotonic() - cached[0] < self.HEALTH_TTL:
+                logger.debug("Using cached health for service: %s", service)
+                return cached[1]
+        
+        if _LOG_INFO:
+            logger.info("Checking health for service: %s", service)
+        result = await self.manage_service(service_flag, DatabaseCommand.HEALTH)
+        self._health_cache[service_flag] = (time.monotonic(), result)
+        return result
     
-    def start_all_services(self) -> Dict[str, Any]:
+    async def start_all_services(self) -> Dict[str, Any]:
         """
         Start all database services at once.
                     
         Returns:
             Dictionary containing the results of the operation.
         """
-        logger.info("Starting all services")
-        return self.manage_all_services(AllServicesCommand.START)
+        if _LOG_INFO:
+            logger.info("Starting all services")
+        return await self.manage_all_services(AllServicesCommand.START)
     
-    def stop_all_services(self) -> Dict[str, Any]:
+    async def stop_all_services(self) -> Dict[str, Any]:
         """
         Stop all database services at once.
                     
         Returns:
             Dictionary containing the results of the operation.
         """
-        logger.info("Stopping all services")
-        return self.manage_all_services(AllServicesCommand.STOP)
+        if _LOG_INFO:
+            logger.info("Stopping all services")
+        return await self.manage_all_services(AllServicesCommand.STOP)
     
-    def show_all_statistics(self) -> Dict[str, Any]:
+    async def show_all_statistics(self, max_age: float = 5.0, refresh: bool = False) -> Dict[str, Any]:
         """
         Show statistics for all database services.
+        
+        Served from a snapshot so dashboards polling this do not run the script on
+        every call: a snapshot older than max_age is returned as-is while a single
+        background refresh replaces it, so the script runs at most about once per
+        max_age seconds.
+        
+        Args:
+            max_age: Seconds after which the snapshot is refreshed in the background.
+            refresh: Wait for a fresh run instead of using the snapshot.
                     
         Returns:
             Dictionary containing the statistics and results of the operation.
         """
-        logger.info("Showing statistics for all services")
-        return self.manage_all_services(AllServicesCommand.STATUS)
+        if _LOG_INFO:
+            logger.info("Showing statistics for all services")
+        snapshot = self._stats_snapshot
+        if refresh or snapshot is None:
+            return await self._refresh_statistics()
+        
+        if time.monotonic() - snapshot[0] > max_age and (self._stats_task is None or self._stats_task.done()):
+            self._stats_task = asyncio.create_task(self._refresh_statistics())
+            self._stats_task.add_done_callback(self._log_refresh_failure)
+        return snapshot[1]
     
-    def backup_all_databases(self) -> Dict[str, Any]:
+    async def _refresh_statistics(self) -> Dict[str, Any]:
+        """Run the all-services status command and store the result as the snapshot."""
+        result = await self.manage_all_services(AllServicesCommand.STATUS)
+        self._stats_snapshot = (time.monotonic(), result)
+        return result
+    
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Task) -> None:
+        """Done-callback for background statistics refreshes: log instead of losing errors."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Background statistics refresh failed: %s", task.exception())
+    
+    async def backup_all_databases(self) -> Dict[str, Any]:
         """
         Backup all databases at once.
                     
         Returns:
             Dictionary containing the results of the backup operations.
         """
-        logger.info("Backing up all databases")
-        return self.manage_all_services(AllServicesCommand.BACKUP)
+        if _LOG_INFO:
+            logger.info("Backing up all databases")
+        return await self.manage_all_services(AllServicesCommand.BACKUP)
 
-def _run_function(args: List[str]) -> Dict[str, Any]:
-        """a function to run the dbctl.rc.sh script."""
+class _CommandBatch:
+    """Service commands queued by _DBController.batch(), flushed through manage_many() on exit."""
+    
+    __slots__ = ("_controller", "_pairs", "result")
+    
+    def __init__(self, controller: _DBController):
+        self._controller = controller
+        self._pairs: List[Tuple[Union[DatabaseService, str], Union[DatabaseCommand, str]]] = []
+        self.result: Optional[Dict[str, Any]] = None
+    
+    def add(self, service: Union[DatabaseService, str], command: Union[DatabaseCommand, str]) -> "_CommandBatch":
+        """
+        Queue one service command, validating it immediately.
+        
+        Raises:
+            ValueError: If an invalid service or command is provided.
+        """
+        _resolve(service, command)
+        self._pairs.append((service, command))
+        return self
+    
+    async def __aenter__(self) -> "_CommandBatch":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None and self._pairs:
+            self.result = await self._controller.manage_many(self._pairs)
+
+# (method name, command, log message, docstring summary) for the per-service shortcuts
+_SERVICE_SHORTCUTS = (
+    ("start_service", DatabaseCommand.START, "Starting service", "Start a specific database service."),
+    ("stop_service", DatabaseCommand.STOP, "Stopping service", "Stop a specific database service."),
+    ("restart_service", DatabaseCommand.RESTART, "Restarting service", "Restart a specific database service."),
+    ("view_logs", DatabaseCommand.LOGS, "Viewing logs for service", "View logs for a specific database service."),
+    ("backup_database", DatabaseCommand.BACKUP, "Backing up database", "Backup a specific database."),
+    ("connect_to_cli", DatabaseCommand.CONNECT, "Connecting to CLI for service",
+     "Connect to the command-line interface of a specific database."),
+    ("show_statistics", DatabaseCommand.STATS, "Showing statistics for service",
+     "Show statistics for a specific database service."),
+)
+
+def _make_service_method(name: str, command: DatabaseCommand, message: str, summary: str):
+    """
+    Build a shortcut method bound to one command.
+    
+    Argv is resolved through the shared _resolve() cache before calling the
+    script directly, skipping manage_service()'s extra frame and logging.
+    """
+    async def method(self, service: Union[DatabaseService, str]) -> Dict[str, Any]:
+        argv = _resolve(service, command)
+        if _LOG_INFO:
+            logger.info("%s: %s", message, service)
+        return await self._run_command(argv)
+    
+    method.__name__ = name
+    method.__qualname__ = f"_DBController.{name}"
+    method.__doc__ = f"""
+        {summary}
+        
+        Equivalent to manage_service(service, DatabaseCommand.{command.name}).
+        
+        Args:
+            service: The database service, as a DatabaseService or its flag string.
+                    
+        Returns:
+            Dictionary containing the results of the operation.
+            
+        Raises:
+            ValueError: If an invalid service is provided.
+        """
+    return method
+
+for _name, _command, _message, _summary in _SERVICE_SHORTCUTS:
+    setattr(_DBController, _name, _make_service_method(_name, _command, _message, _summary))
+del _name, _command, _message, _summary
+
+# core.utils.scripts.run_db_ctl, resolved on first use (see _db_ctl_runner)
+_run_db_ctl = None
+
+def _db_ctl_runner():
+    """Import run_db_ctl once and keep it, so later commands skip the import machinery."""
+    global _run_db_ctl
+    if _run_db_ctl is None:
         from core.utils.scripts import run_db_ctl
-        return run_db_ctl(args) 
+        _run_db_ctl = run_db_ctl
+    return _run_db_ctl
+
+async def _run_function(args: List[str]) -> int:
+        """a function to run the dbctl.rc.sh script."""
+        return await (_run_db_ctl or _db_ctl_runner())(args)
 
 local_db_controller = _DBController(_run_function)